@@ -7,32 +7,69 @@ les performances des différents algorithmes de compression et calculer les
 seuils de transmission optimaux où la compression devient avantageuse.
 """
 
+import io
+import multiprocessing
+import os
 import time
 import statistics
-import random
-from typing import List, Dict, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.context import BaseContext
+from typing import Callable, List, Dict, Optional, Sequence, Tuple
 from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
 from bit_packing import BitPackingBase
 from factory import BitPackingFactory, CompressionType
 
 
+# Générateur pseudo-aléatoire partagé par les générateurs de données (remplissage vectorisé en C)
+_RNG = np.random.default_rng()
+
+# Durée visée pour un échantillon de timing: les appels rapides sont regroupés
+# jusqu'à environ 1 ms afin d'amortir le coût de lecture de l'horloge
+_TARGET_SAMPLE_NS = 1_000_000
+
+# Arrêt anticipé des mesures: dès _MIN_SAMPLES échantillons, on vérifie tous les
+# _SAMPLE_BATCH échantillons si le coefficient de variation est sous _CONVERGENCE_CV
+_MIN_SAMPLES = 20
+_SAMPLE_BATCH = 10
+_CONVERGENCE_CV = 0.02
+
+
 @dataclass
 class BenchmarkResult:
     """Classe de données pour stocker les résultats de benchmark"""
-    compression_time: float  # Temps moyen de compression en secondes
-    decompression_time: float  # Temps moyen de décompression en secondes
-    get_time: float  # Temps moyen d'accès direct en secondes
+    compression_time: float  # Meilleur temps de compression par appel (minimum des échantillons) en secondes
+    decompression_time: float  # Meilleur temps de décompression par appel (minimum des échantillons) en secondes
+    get_time: float  # Temps moyen d'un appel get() en secondes (moyenne des itérations)
     compression_ratio: float  # Ratio de compression (taille_originale / taille_compressée)
     original_size_bits: int  # Taille originale en bits
     compressed_size_bits: int  # Taille compressée en bits
     algorithm_name: str  # Nom de l'algorithme testé
 
+    @cached_property
+    def processing_overhead(self) -> float:
+        """Surcoût de traitement (compression + décompression) en secondes"""
+        return self.compression_time + self.decompression_time
+
+    @cached_property
+    def size_delta_bits(self) -> int:
+        """Nombre de bits économisés par la compression"""
+        return self.original_size_bits - self.compressed_size_bits
+
 
 class DataGenerator:
-    """Classe utilitaire pour générer des jeux de données de test avec différentes caractéristiques"""
+    """
+    Classe utilitaire pour générer des jeux de données de test avec différentes caractéristiques.
+    Les données sont produites sous forme de tableaux NumPy contigus, acceptés
+    directement par les compresseurs.
+    """
 
     @staticmethod
-    def generate_uniform(size: int, max_value: int) -> List[int]:
+    def generate_uniform(size: int, max_value: int) -> np.ndarray:
         """
         Génère des entiers distribués uniformément.
 
@@ -41,12 +78,12 @@ class DataGenerator:
             max_value: Valeur maximale (inclusive)
 
         Returns:
-            List[int]: Liste d'entiers aléatoires uniformément distribués
+            np.ndarray: Tableau int64 d'entiers aléatoires uniformément distribués
         """
-        return [random.randint(0, max_value) for element_index in range(size)]
+        return _RNG.integers(0, max_value + 1, size=size, dtype=np.int64)
 
     @staticmethod
-    def generate_power_law(size: int, max_value: int, alpha: float = 2.0) -> List[int]:
+    def generate_power_law(size: int, max_value: int, alpha: float = 2.0) -> np.ndarray:
         """
         Génère des entiers suivant une distribution en loi de puissance.
         Simule des données réelles où beaucoup de petites valeurs et peu de grandes.
@@ -57,19 +94,17 @@ class DataGenerator:
             alpha: Exposant de la loi de puissance (>1, typiquement 2.0)
 
         Returns:
-            List[int]: Liste d'entiers suivant une loi de puissance
+            np.ndarray: Tableau int64 d'entiers suivant une loi de puissance
         """
-        data = []
-        for iteration_index in range(size):
-            # Générer une valeur suivant une loi de puissance
-            random_uniform = random.random()
-            value = int((1 - random_uniform) ** (-1 / (alpha - 1)) * 10)
-            value = min(value, max_value)  # Limiter à max_value
-            data.append(value)
-        return data
+        # Générer toutes les valeurs par inversion de la fonction de répartition
+        random_uniform = _RNG.random(size)
+        values = (1.0 - random_uniform) ** (-1.0 / (alpha - 1.0)) * 10.0
+        # Limiter à max_value avant la conversion pour éviter tout débordement int64
+        np.minimum(values, max_value, out=values)
+        return values.astype(np.int64)
 
     @staticmethod
-    def generate_with_outliers(size: int, normal_max: int, outlier_value: int, outlier_ratio: float = 0.05) -> List[int]:
+    def generate_with_outliers(size: int, normal_max: int, outlier_value: int, outlier_ratio: float = 0.05) -> np.ndarray:
         """
         Génère des données avec des outliers (valeurs aberrantes).
         Utile pour tester la compression overflow.
@@ -81,54 +116,60 @@ class DataGenerator:
             outlier_ratio: Proportion d'outliers (0.05 = 5%)
 
         Returns:
-            List[int]: Liste avec majoritairement des petites valeurs et quelques outliers
+            np.ndarray: Tableau int64 avec majoritairement des petites valeurs et quelques outliers
         """
-        data = []
         num_outliers = int(size * outlier_ratio)
 
         # Générer les outliers et les valeurs normales
-        for element_index in range(size):
-            if element_index < num_outliers:
-                data.append(outlier_value)
-            else:
-                data.append(random.randint(0, normal_max))
+        data = np.concatenate((
+            np.full(num_outliers, outlier_value, dtype=np.int64),
+            _RNG.integers(0, normal_max + 1, size=size - num_outliers, dtype=np.int64),
+        ))
 
         # Mélanger pour distribuer les outliers aléatoirement
-        random.shuffle(data)
+        _RNG.shuffle(data)
         return data
 
     @staticmethod
-    def generate_sequential(size: int, start: int = 0) -> List[int]:
+    def generate_sequential(size: int, start: int = 0) -> np.ndarray:
         """
         Génère des entiers séquentiels.
+        Le tableau est en int64 et non en int32, comme les autres générateurs:
+        les compresseurs travaillent en int64 et le reprennent sans copie (un
+        int32 serait converti à chaque compress(), donc dans les temps mesurés),
+        et un grand start ne peut pas déborder.
 
         Args:
             size: Nombre d'éléments
             start: Valeur de départ
 
         Returns:
-            List[int]: Liste séquentielle [start, start+1, start+2, ...]
+            np.ndarray: Tableau int64 séquentiel [start, start+1, start+2, ...]
         """
-        return list(range(start, start + size))
+        return np.arange(start, start + size, dtype=np.int64)
 
 
 class BenchmarkSuite:
     """Suite de benchmarking complète pour les algorithmes bit packing"""
 
-    def __init__(self, num_iterations: int = 100):
+    def __init__(self, num_iterations: int = 100, seed: int = 0):
         """
         Initialise la suite de benchmark.
 
         Args:
             num_iterations: Nombre d'itérations pour les mesures de timing
                            (plus élevé = plus précis mais plus lent)
+            seed: Graine des indices d'accès aléatoire (benchmarks reproductibles)
         """
         self.num_iterations = num_iterations
+        self.seed = seed
         self.results: Dict[str, List[BenchmarkResult]] = {}
+        self._rng = np.random.default_rng(seed)
+        self._test_indices_cache: Dict[int, Tuple[int, ...]] = {}
 
     def benchmark_algorithm(self,
                           algorithm: BitPackingBase,
-                          data: List[int],
+                          data: Sequence[int],
                           algorithm_name: str) -> BenchmarkResult:
         """
         Benchmark un seul algorithme sur des données données.
@@ -143,83 +184,211 @@ class BenchmarkSuite:
             BenchmarkResult: Résultats complets du benchmark
         """
         # Mesurer le temps de compression sur plusieurs itérations
-        compression_times = []
-        for iteration_counter in range(self.num_iterations):
-            start_time = time.perf_counter()
-            compressed = algorithm.compress(data.copy())
-            end_time = time.perf_counter()
-            compression_times.append(end_time - start_time)
-
-        # Utiliser la dernière compression pour les tests suivants
-        compressed = algorithm.compress(data.copy())
+        # (les compresseurs ne modifient pas leur entrée: aucune copie nécessaire)
+        # Le résultat de la dernière compression chronométrée sert aux tests suivants
+        compression_times, compressed = self._time_operation(lambda: algorithm.compress(data),
+                                                             self.num_iterations)
 
         # Mesurer le temps de décompression
-        decompression_times = []
-        for iteration_counter in range(self.num_iterations):
-            start_time = time.perf_counter()
-            decompressed = algorithm.decompress(compressed.copy())
-            end_time = time.perf_counter()
-            decompression_times.append(end_time - start_time)
+        decompression_times, decompressed = self._time_operation(lambda: algorithm.decompress(compressed),
+                                                                 self.num_iterations)
 
         # Mesurer le temps d'accès aléatoire (opération get)
         get_times = []
-        # Préparer des indices de test aléatoires
-        test_indices = [random.randint(0, len(data) - 1) for test_index_counter in range(min(100, len(data)))]
+        # Préparer des indices de test aléatoires, partagés par les algorithmes d'un même dataset
+        test_indices = self._get_test_indices(len(data))
+        # Mesurer le coût d'un appel get() (pas le débit groupé de get_many()),
+        # comme le chronométrage d'accès de l'interface graphique
+        # Résoudre la méthode et le nombre d'accès une seule fois, hors de la zone chronométrée
+        get = algorithm.get
+        num_accesses = len(test_indices)
+
+        # Passe d'échauffement non chronométrée sur les mêmes indices
+        deque(map(get, test_indices), maxlen=0)
 
         # Mesurer avec moins d'itérations car get() est rapide
         for iteration_counter in range(self.num_iterations // 10):
-            start_time = time.perf_counter()
-            for test_index in test_indices:
-                _ = algorithm.get(test_index)
-            end_time = time.perf_counter()
+            start_time = time.perf_counter_ns()
+            # Itération pilotée en C: seul l'appel à get() reste en Python
+            deque(map(get, test_indices), maxlen=0)
+            end_time = time.perf_counter_ns()
             # Diviser par le nombre d'accès pour obtenir le temps moyen par accès
-            get_times.append((end_time - start_time) / len(test_indices))
+            get_times.append((end_time - start_time) / num_accesses)
 
         # Calculer les métriques de compression
-        original_size_bits = len(data) * 32  # En assumant des entiers 32-bit
+        original_size_bits = len(data) * self._source_word_bits(data)
         compressed_size_bits = len(compressed) * 32
         compression_ratio = original_size_bits / compressed_size_bits if compressed_size_bits > 0 else 0
 
         return BenchmarkResult(
-            compression_time=statistics.mean(compression_times),
-            decompression_time=statistics.mean(decompression_times),
-            get_time=statistics.mean(get_times),
+            # Compression et décompression: le minimum des échantillons est l'estimateur
+            # le plus robuste du coût réel (convention pyperf); get: moyenne par appel
+            compression_time=min(compression_times) / 1e9,
+            decompression_time=min(decompression_times) / 1e9,
+            get_time=sum(get_times) / len(get_times) / 1e9,
             compression_ratio=compression_ratio,
             original_size_bits=original_size_bits,
             compressed_size_bits=compressed_size_bits,
             algorithm_name=algorithm_name
         )
 
-    def run_comprehensive_benchmark(self, datasets: Dict[str, List[int]]) -> Dict[str, Dict[str, BenchmarkResult]]:
+    def _get_test_indices(self, data_size: int) -> Tuple[int, ...]:
+        """
+        Retourne les indices d'accès aléatoire pour une taille de données.
+        Tirés en une fois depuis le générateur graine et mis en cache par taille.
+
+        Args:
+            data_size: Nombre d'éléments des données testées
+
+        Returns:
+            Tuple[int, ...]: Indices (tuple: itération plus rapide qu'une liste)
+        """
+        test_indices = self._test_indices_cache.get(data_size)
+        if test_indices is None:
+            test_indices = tuple(self._rng.integers(0, data_size, size=min(100, data_size)).tolist())
+            self._test_indices_cache[data_size] = test_indices
+        return test_indices
+
+    @staticmethod
+    def _source_word_bits(data: Sequence[int]) -> int:
+        """
+        Détermine la largeur des entiers du tableau original tel qu'il serait transmis.
+        Les données tiennent dans des entiers 32-bit signés sauf si une valeur
+        en déborde, auquel cas il faut des entiers 64-bit.
+
+        Args:
+            data: Données de test
+
+        Returns:
+            int: 32 ou 64 selon la plage des valeurs
+        """
+        if len(data) == 0:
+            return 32
+        values = np.asarray(data)
+        fits_int32 = int(values.min()) >= -(1 << 31) and int(values.max()) < (1 << 31)
+        return 32 if fits_int32 else 64
+
+    def _time_operation(self, operation: Callable[[], object], num_samples: int) -> Tuple[List[float], object]:
+        """
+        Mesure le temps d'exécution d'une opération sur plusieurs échantillons.
+        Chaque échantillon regroupe assez d'appels pour durer environ 1 ms, comme
+        le fait timeit, afin que le coût de l'horloge reste négligeable. La mesure
+        s'arrête avant num_samples dès que les temps sont stables.
+
+        Args:
+            operation: Fonction sans argument à chronométrer
+            num_samples: Nombre maximal d'échantillons à mesurer
+
+        Returns:
+            Tuple: (temps moyen par appel pour chaque échantillon en nanosecondes,
+                    résultat du dernier appel)
+        """
+        # Appel d'échauffement non chronométré: absorbe les coûts de premier
+        # accès (allocateur, caches) qui fausseraient la calibration
+        operation()
+
+        # Estimer la durée d'un appel pour calibrer la taille des échantillons
+        start_time = time.perf_counter_ns()
+        last_result = operation()
+        estimated_time = max(1, time.perf_counter_ns() - start_time)
+        calls_per_sample = max(1, _TARGET_SAMPLE_NS // estimated_time)
+
+        sample_times = []
+        for sample_index in range(num_samples):
+            start_time = time.perf_counter_ns()
+            for call_index in range(calls_per_sample):
+                last_result = operation()
+            end_time = time.perf_counter_ns()
+            sample_times.append((end_time - start_time) / calls_per_sample)
+
+            # Vérifier la convergence à la fin de chaque lot d'échantillons
+            num_measured = len(sample_times)
+            if num_measured >= _MIN_SAMPLES and num_measured % _SAMPLE_BATCH == 0:
+                mean_time = sum(sample_times) / num_measured
+                if mean_time > 0 and statistics.stdev(sample_times) / mean_time < _CONVERGENCE_CV:
+                    break
+
+        return sample_times, last_result
+
+    def _benchmark_type(self,
+                        compression_type: CompressionType,
+                        data: Sequence[int],
+                        algorithm_name: str) -> BenchmarkResult:
+        """
+        Benchmark un type de compression avec l'instance partagée de la factory.
+        Les paires sont mesurées l'une après l'autre et compress() réinitialise
+        tout l'état du compresseur: une instance par type suffit.
+
+        Args:
+            compression_type: Type de compression à tester
+            data: Données de test
+            algorithm_name: Nom pour les rapports
+
+        Returns:
+            BenchmarkResult: Résultats complets du benchmark
+        """
+        algorithm = BitPackingFactory.create_compressor(compression_type, shared=True)
+        return self.benchmark_algorithm(algorithm, data, algorithm_name)
+
+    def run_comprehensive_benchmark(self,
+                                    datasets: Dict[str, Sequence[int]],
+                                    max_workers: Optional[int] = 1) -> Dict[str, Dict[str, BenchmarkResult]]:
         """
         Exécute des benchmarks complets sur plusieurs jeux de données et algorithmes.
+        Par défaut les paires (dataset, algorithme) sont mesurées l'une après
+        l'autre dans ce processus: des mesures simultanées se disputent le cache,
+        la bande passante mémoire et le turbo du CPU, et leurs temps ne sont plus
+        comparables. Avec plusieurs processus, chacun reçoit sa propre suite.
 
         Args:
             datasets: Dictionnaire mappant noms de datasets -> tableaux de données
+            max_workers: Nombre maximal de processus (1 par défaut; None = nombre de CPU,
+                plus rapide mais les temps mesurés en parallèle ne sont pas comparables)
 
         Returns:
             Dict: Dictionnaire imbriqué avec résultats [dataset][algorithme] = BenchmarkResult
         """
-        results = {}
-        # Créer les trois algorithmes à tester
+        # Les trois algorithmes à tester
         algorithms = {
-            "Simple": BitPackingFactory.create_compressor(CompressionType.SIMPLE),
-            "Aligned": BitPackingFactory.create_compressor(CompressionType.ALIGNED),
-            "Overflow": BitPackingFactory.create_compressor(CompressionType.OVERFLOW)
+            "Simple": CompressionType.SIMPLE,
+            "Aligned": CompressionType.ALIGNED,
+            "Overflow": CompressionType.OVERFLOW
         }
 
-        for dataset_name, data in datasets.items():
-            print(f"Benchmarking du dataset: {dataset_name} (taille: {len(data)})")
-            results[dataset_name] = {}
-
-            for algo_name, algorithm in algorithms.items():
-                print(f"  Test de l'algorithme {algo_name}...")
+        # Pré-remplir les résultats pour conserver l'ordre des datasets
+        results = {dataset_name: {} for dataset_name in datasets}
+
+        def record(dataset_name: str, algo_name: str, result: BenchmarkResult):
+            results[dataset_name][algo_name] = result
+            self.results.setdefault(dataset_name, []).append(result)
+            print(f"  {dataset_name} / {algo_name}: ratio de compression {result.compression_ratio:.2f}")
+
+        if max_workers == 1:
+            # Mesures en série sur cette suite (le cache d'indices sert entre algorithmes)
+            for dataset_name, data in datasets.items():
+                print(f"Benchmarking du dataset: {dataset_name} (taille: {len(data)})")
+                for algo_name, compression_type in algorithms.items():
+                    try:
+                        record(dataset_name, algo_name, self._benchmark_type(compression_type, data, algo_name))
+                    except Exception as e:
+                        print(f"  Erreur lors du test de {algo_name} sur {dataset_name}: {e}")
+            return results
+
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker_suite,
+                                 initargs=(self.num_iterations, self.seed)) as executor:
+            pending = {}
+            for dataset_name, data in datasets.items():
+                print(f"Benchmarking du dataset: {dataset_name} (taille: {len(data)})")
+                for algo_name, compression_type in algorithms.items():
+                    future = executor.submit(_benchmark_pair, compression_type, data, algo_name)
+                    pending[future] = (dataset_name, algo_name)
+
+            for future in as_completed(pending):
+                dataset_name, algo_name = pending[future]
                 try:
-                    result = self.benchmark_algorithm(algorithm, data, algo_name)
-                    results[dataset_name][algo_name] = result
-                    print(f"    Ratio de compression: {result.compression_ratio:.2f}")
+                    record(dataset_name, algo_name, future.result())
                 except Exception as e:
-                    print(f"    Erreur lors du test de {algo_name}: {e}")
+                    print(f"  Erreur lors du test de {algo_name} sur {dataset_name}: {e}")
 
         return results
 
@@ -242,55 +411,65 @@ class BenchmarkSuite:
         # Convertir la vitesse de transmission en bits par seconde
         transmission_speed_bps = transmission_speed_mbps * 1_000_000
 
-        # Calculer les temps de transmission
-        original_transmission_time = benchmark_result.original_size_bits / transmission_speed_bps
-        compressed_transmission_time = benchmark_result.compressed_size_bits / transmission_speed_bps
-
-        # Calculer le surcoût de traitement
-        processing_overhead = benchmark_result.compression_time + benchmark_result.decompression_time
+        # Surcoût de traitement et écart de taille sont précalculés une fois par résultat
+        processing_overhead = benchmark_result.processing_overhead
 
-        # Calculer le temps économisé par la compression
-        time_saved = original_transmission_time - compressed_transmission_time
+        # Calculer le temps économisé par la compression (une seule division)
+        time_saved = benchmark_result.size_delta_bits / transmission_speed_bps
 
         # Si le surcoût > temps économisé, la compression n'est jamais bénéfique
         if time_saved <= processing_overhead:
             return float('inf')  # Jamais bénéfique
 
         # Retourner la latence où les bénéfices commencent
-        return processing_overhead / (time_saved - processing_overhead) if time_saved > processing_overhead else 0
+        return processing_overhead / (time_saved - processing_overhead)
 
-    def benchmark_selective_algorithms(self, data: List[int]) -> Dict[str, Dict[str, float]]:
+    def benchmark_selective_algorithms(self,
+                                       data: Sequence[int],
+                                       max_workers: Optional[int] = 1,
+                                       mp_context: Optional[BaseContext] = None,
+                                       progress: Optional[Callable[[str], None]] = None) -> Dict[str, Dict[str, float]]:
         """
         Benchmark les algorithmes de façon sélective selon le type de données.
+        Par défaut les algorithmes sont mesurés l'un après l'autre dans ce
+        processus (voir run_comprehensive_benchmark); avec plusieurs processus,
+        ils sont mesurés en parallèle.
 
         - Si les données contiennent des nombres négatifs: teste uniquement ZigZag
         - Si les données sont positives: teste tous les algorithmes (Simple, Aligned, Overflow, ZigZag)
 
         Args:
             data: Données à tester
+            max_workers: Nombre maximal de processus (1 par défaut; None = nombre de CPU,
+                plus rapide mais les temps mesurés en parallèle ne sont pas comparables)
+            mp_context: Contexte multiprocessing des processus (None = "spawn": appelé
+                depuis un thread de l'interface, un fork du processus Qt multithreadé
+                peut se bloquer)
+            progress: Appelée avec le nom de chaque algorithme dès qu'il est mesuré
 
         Returns:
             Dict: Dictionnaire avec résultats [algorithme] = métriques
         """
-        has_negatives = any(x < 0 for x in data)
-        results = {}
+        has_negatives = bool(np.any(np.asarray(data) < 0))
 
         if has_negatives:
             # Pour les données négatives: uniquement ZigZag
             algorithms_to_test = {
-                "zigzag": BitPackingFactory.create_compressor(CompressionType.ZIGZAG)
+                "zigzag": CompressionType.ZIGZAG
             }
         else:
             # Pour les données positives: tous les algorithmes
             algorithms_to_test = {
-                "simple": BitPackingFactory.create_compressor(CompressionType.SIMPLE),
-                "aligned": BitPackingFactory.create_compressor(CompressionType.ALIGNED),
-                "overflow": BitPackingFactory.create_compressor(CompressionType.OVERFLOW),
-                "zigzag": BitPackingFactory.create_compressor(CompressionType.ZIGZAG)
+                "simple": CompressionType.SIMPLE,
+                "aligned": CompressionType.ALIGNED,
+                "overflow": CompressionType.OVERFLOW,
+                "zigzag": CompressionType.ZIGZAG
             }
 
-        for algo_name, algorithm in algorithms_to_test.items():
-            result = self.benchmark_algorithm(algorithm, data, algo_name)
+        # Pré-remplir les résultats pour un affichage stable dans l'ordre des algorithmes
+        results = dict.fromkeys(algorithms_to_test)
+
+        def record(algo_name: str, result: BenchmarkResult):
             results[algo_name] = {
                 'compression_ratio': result.compression_ratio,
                 'compression_time': result.compression_time * 1000,  # Convert to ms
@@ -299,6 +478,27 @@ class BenchmarkSuite:
                 'original_size': result.original_size_bits,
                 'compressed_size': result.compressed_size_bits
             }
+            if progress is not None:
+                progress(algo_name)
+
+        if max_workers == 1:
+            for algo_name, compression_type in algorithms_to_test.items():
+                record(algo_name, self._benchmark_type(compression_type, data, algo_name))
+            return results
+
+        if mp_context is None:
+            mp_context = multiprocessing.get_context("spawn")
+
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context,
+                                 initializer=_init_worker_suite,
+                                 initargs=(self.num_iterations, self.seed)) as executor:
+            pending = {
+                executor.submit(_benchmark_pair, compression_type, data, algo_name): algo_name
+                for algo_name, compression_type in algorithms_to_test.items()
+            }
+            # Signaler chaque algorithme dès qu'il se termine
+            for future in as_completed(pending):
+                record(pending[future], future.result())
 
         return results
 
@@ -312,12 +512,14 @@ class BenchmarkSuite:
         Returns:
             str: Rapport formaté prêt à afficher ou sauvegarder
         """
-        report = []
-        report.append("=== RAPPORT DE BENCHMARK - COMPRESSION BIT PACKING ===\n")
+        # Tampon unique: évite d'accumuler puis de joindre des milliers de petites chaînes
+        report = io.StringIO()
+        write = report.write
+        write("=== RAPPORT DE BENCHMARK - COMPRESSION BIT PACKING ===\n\n")
 
         for dataset_name, dataset_results in results.items():
-            report.append(f"Dataset: {dataset_name}")
-            report.append("-" * 50)
+            write(f"Dataset: {dataset_name}\n")
+            write("-" * 50 + "\n")
 
             # Fonction helper pour extraire le ratio de compression d'un résultat
             def extract_compression_ratio(result_tuple: Tuple[str, BenchmarkResult]) -> float:
@@ -331,25 +533,60 @@ class BenchmarkSuite:
                                   reverse=True)
 
             for algo_name, result in sorted_results:
-                report.append(f"\nAlgorithme: {algo_name}")
-                report.append(f"  Ratio de compression: {result.compression_ratio:.3f}x")
-                report.append(f"  Temps de compression: {result.compression_time*1000:.3f} ms")
-                report.append(f"  Temps de décompression: {result.decompression_time*1000:.3f} ms")
-                report.append(f"  Temps d'accès aléatoire: {result.get_time*1000000:.3f} μs")
-                report.append(f"  Taille originale: {result.original_size_bits/8:.0f} octets")
-                report.append(f"  Taille compressée: {result.compressed_size_bits/8:.0f} octets")
+                write(f"\nAlgorithme: {algo_name}\n")
+                write(f"  Ratio de compression: {result.compression_ratio:.3f}x\n")
+                write(f"  Temps de compression (minimum): {result.compression_time*1000:.3f} ms\n")
+                write(f"  Temps de décompression (minimum): {result.decompression_time*1000:.3f} ms\n")
+                write(f"  Temps d'accès aléatoire (get, moyenne par appel): {result.get_time*1000000:.3f} μs\n")
+                write(f"  Taille originale: {result.original_size_bits/8:.0f} octets\n")
+                write(f"  Taille compressée: {result.compressed_size_bits/8:.0f} octets\n")
 
                 # Calculer les seuils de transmission pour différentes vitesses
                 for speed in [1, 10, 100, 1000]:  # Mbps
                     threshold = self.calculate_transmission_threshold(result, speed)
                     if threshold == float('inf'):
-                        report.append(f"  Seuil à {speed} Mbps: Jamais bénéfique")
+                        write(f"  Seuil à {speed} Mbps: Jamais bénéfique\n")
                     else:
-                        report.append(f"  Seuil à {speed} Mbps: {threshold*1000:.3f} ms de latence")
+                        write(f"  Seuil à {speed} Mbps: {threshold*1000:.3f} ms de latence\n")
+
+            write("\n" + "="*70 + "\n\n")
 
-            report.append("\n" + "="*70 + "\n")
+        return report.getvalue()
 
-        return "\n".join(report)
+
+# Suite du processus de travail courant, créée une fois par _init_worker_suite
+_worker_suite: Optional[BenchmarkSuite] = None
+
+
+def _init_worker_suite(num_iterations: int, seed: int) -> None:
+    """
+    Initialise la suite d'un processus de travail (initializer du pool): ses
+    paires partagent ainsi le cache d'indices et les compresseurs.
+
+    Args:
+        num_iterations: Nombre d'itérations pour les mesures de timing
+        seed: Graine des indices d'accès aléatoire
+    """
+    global _worker_suite
+    _worker_suite = BenchmarkSuite(num_iterations, seed)
+
+
+def _benchmark_pair(compression_type: CompressionType,
+                    data: Sequence[int],
+                    algorithm_name: str) -> BenchmarkResult:
+    """
+    Mesure une paire (dataset, algorithme) dans un processus de travail.
+    Définie au niveau du module pour pouvoir être sérialisée par multiprocessing.
+
+    Args:
+        compression_type: Type de compression à tester
+        data: Données de test
+        algorithm_name: Nom pour les rapports
+
+    Returns:
+        BenchmarkResult: Résultats complets du benchmark
+    """
+    return _worker_suite._benchmark_type(compression_type, data, algorithm_name)
 
 
 def run_default_benchmarks() -> Dict[str, Dict[str, BenchmarkResult]]:
@@ -372,13 +609,31 @@ def run_default_benchmarks() -> Dict[str, Dict[str, BenchmarkResult]]:
         "Petites Valeurs": DataGenerator.generate_uniform(10000, 15),  # Bon pour l'alignement
     }
 
-    # Exécuter les benchmarks
+    # Exécuter les benchmarks en série: les temps du rapport restent comparables
     benchmark_suite = BenchmarkSuite(num_iterations=50)
-    results = benchmark_suite.run_comprehensive_benchmark(datasets)
+    results = benchmark_suite.run_comprehensive_benchmark(datasets, max_workers=1)
 
     return results
 
 
+def save_default_benchmark_report(output_path: str) -> None:
+    """
+    Exécute les benchmarks par défaut et écrit le rapport dans un fichier.
+    Sert de cible à un processus enfant: le fichier n'apparaît qu'une fois
+    complet (écriture dans un fichier temporaire puis renommage atomique).
+
+    Args:
+        output_path: Chemin du rapport texte à produire
+    """
+    results = run_default_benchmarks()
+    report = BenchmarkSuite().generate_report(results)
+
+    temporary_path = output_path + ".tmp"
+    with open(temporary_path, "w", encoding="utf-8") as f:
+        f.write(report)
+    os.replace(temporary_path, output_path)
+
+
 if __name__ == "__main__":
     # Exécuter les benchmarks par défaut si le script est lancé directement
     results = run_default_benchmarks()
@@ -11,9 +11,296 @@ Chaque algorithme compresse les données en utilisant le nombre minimum de bits
 pour représenter chaque valeur, réduisant ainsi la taille de transmission.
 """
 
-import math
+import os
 from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Sequence
+
+import numpy as np
+
+
+# Largeurs alignées sur l'octet: les valeurs sont directement les octets, demi-mots
+# ou mots little-endian des mots 32-bit empaquetés
+_BYTE_WIDTH_DTYPES = {8: '<u1', 16: '<u2', 32: '<u4'}
+
+# En dessous de cette taille, découper le travail entre threads coûte plus qu'il ne rapporte
+_PARALLEL_MIN_VALUES = 1 << 20
+_PARALLEL_WORKERS = os.cpu_count() or 1
+
+# Valeurs traitées par tuile: les tableaux temporaires de NumPy (quelques
+# centaines de Ko) restent dans le cache au lieu de parcourir toute la mémoire
+_TILE_VALUES = 1 << 15
+
+
+def _word_aligned_ranges(values: range, num_bits: int, size: int) -> List[range]:
+    """
+    Découpe une plage de valeurs en sous-plages d'environ size valeurs. Chaque
+    frontière tombe sur un multiple de 32 // pgcd(32, num_bits) valeurs, donc au
+    début d'un mot: deux sous-plages ne partagent jamais de mot.
+
+    Args:
+        values: Plage de valeurs à découper (son début doit être aligné sur un mot)
+        num_bits: Nombre de bits par valeur (1 à 32)
+        size: Taille visée des sous-plages
+
+    Returns:
+        List[range]: Sous-plages consécutives couvrant values
+    """
+    # pgcd(32, num_bits) est la plus grande puissance de 2 qui divise num_bits
+    values_per_boundary = 32 // (num_bits & -num_bits)
+    size = max(1, -(-size // values_per_boundary)) * values_per_boundary
+    return [range(start, min(start + size, values.stop)) for start in range(values.start, values.stop, size)]
+
+
+def _parallel_blocks(count: int, num_bits: int) -> List[range]:
+    """
+    Découpe count valeurs en blocs indépendants alignés sur les mots, un par thread.
+
+    Args:
+        count: Nombre de valeurs
+        num_bits: Nombre de bits par valeur (1 à 32)
+
+    Returns:
+        List[range]: Plages de valeurs (un seul bloc si le parallélisme ne vaut pas la peine)
+    """
+    if _PARALLEL_WORKERS <= 1 or count < _PARALLEL_MIN_VALUES:
+        return [range(0, count)]
+    return _word_aligned_ranges(range(0, count), num_bits, -(-count // _PARALLEL_WORKERS))
+
+
+def _run_blocks(function, blocks: List[range]):
+    """Applique function à chaque bloc, en parallèle s'il y en a plusieurs."""
+    if len(blocks) == 1:
+        function(blocks[0])
+        return
+    with ThreadPoolExecutor(max_workers=len(blocks)) as executor:
+        list(executor.map(function, blocks))
+
+
+def _pack_bits(values: np.ndarray, num_bits: int, num_words: int) -> np.ndarray:
+    """
+    Empaquète des valeurs de num_bits bits, bout à bout, dans des mots 32-bit.
+    Le travail est découpé en tuiles alignées sur les mots; les grands tableaux
+    sont en plus répartis entre threads (NumPy relâche le GIL pendant ses calculs).
+
+    Args:
+        values: Valeurs à empaqueter (uint64, déjà masquées sur num_bits bits)
+        num_bits: Nombre de bits par valeur (1 à 64)
+        num_words: Nombre de mots 32-bit de sortie
+
+    Returns:
+        np.ndarray: Mots 32-bit empaquetés (uint32)
+    """
+    # Largeur divisant 32: aucune valeur ne chevauche deux mots, la disposition
+    # est celle du packing aligné et ses noyaux spécialisés s'appliquent
+    if 32 % num_bits == 0:
+        return _pack_aligned(values, num_bits, 32 // num_bits)
+
+    # Plus de 32 bits: une valeur peut toucher trois mots, ce que le scratch
+    # 64-bit ne couvre pas. Elle est écrite en deux champs d'au plus 32 bits:
+    # ses 32 bits bas, puis ses bits hauts juste après
+    if num_bits > 32:
+        start_bits = np.arange(values.size, dtype=np.uint64) * np.uint64(num_bits)
+        words = _scatter_bits(values & np.uint64(0xFFFFFFFF), start_bits, num_words)
+        words |= _scatter_bits(values >> np.uint64(32), start_bits + np.uint64(32), num_words)
+        return words
+
+    words = np.zeros(num_words, dtype=np.uint32)
+
+    def pack_block(block: range):
+        for tile in _word_aligned_ranges(block, num_bits, _TILE_VALUES):
+            first_word = tile.start * num_bits // 32
+            last_word = min(num_words, (tile.stop * num_bits + 31) // 32)
+            words[first_word:last_word] = _pack_block(values[tile.start:tile.stop], num_bits,
+                                                      last_word - first_word)
+
+    _run_blocks(pack_block, _parallel_blocks(values.size, num_bits))
+    return words
+
+
+def _pack_block(values: np.ndarray, num_bits: int, num_words: int) -> np.ndarray:
+    """
+    Empaquète un bloc de valeurs commençant au bit 0 d'un mot.
+    Version vectorisée de l'écriture élément par élément (voir _scatter_bits).
+
+    Args:
+        values: Valeurs à empaqueter (uint64, déjà masquées sur num_bits bits)
+        num_bits: Nombre de bits par valeur (1 à 32)
+        num_words: Nombre de mots 32-bit de sortie
+
+    Returns:
+        np.ndarray: Mots 32-bit empaquetés (uint32)
+    """
+    start_bits = np.arange(values.size, dtype=np.uint64) * np.uint64(num_bits)
+    return _scatter_bits(values, start_bits, num_words)
+
+
+def _scatter_bits(values: np.ndarray, start_bits: np.ndarray, num_words: int) -> np.ndarray:
+    """
+    Écrit des champs d'au plus 32 bits aux positions start_bits (croissantes).
+    Chaque valeur est décalée à son offset dans un scratch 64-bit, puis
+    répartie entre le mot courant (32 bits bas) et le mot suivant (32 bits hauts).
+
+    Args:
+        values: Champs à écrire (uint64, au plus 32 bits chacun)
+        start_bits: Position du premier bit de chaque champ (uint64, croissantes)
+        num_words: Nombre de mots 32-bit de sortie
+
+    Returns:
+        np.ndarray: Mots 32-bit empaquetés (uint32)
+    """
+    word_index = (start_bits >> np.uint64(5)).astype(np.intp)
+    bit_offset = start_bits & np.uint64(31)
+
+    # Un mot de marge pour la partie haute du dernier élément
+    words = np.zeros(num_words + 1, dtype=np.uint64)
+    if values.size == 0:
+        return words[:num_words].astype(np.uint32)
+
+    shifted = values << bit_offset
+    # word_index est croissant: les valeurs d'un même mot sont contiguës et
+    # peuvent être combinées par groupe avec reduceat, sans écriture conflictuelle
+    group_starts = np.flatnonzero(np.diff(word_index, prepend=-1))
+    group_words = word_index[group_starts]
+    words[group_words] |= np.bitwise_or.reduceat(shifted & np.uint64(0xFFFFFFFF), group_starts)
+    words[group_words + 1] |= np.bitwise_or.reduceat(shifted >> np.uint64(32), group_starts)
+    return words[:num_words].astype(np.uint32)
+
+
+def _unpack_bits(words: np.ndarray, num_bits: int, count: int) -> np.ndarray:
+    """
+    Extrait count valeurs de num_bits bits empaquetées bout à bout.
+
+    Args:
+        words: Mots 32-bit empaquetés
+        num_bits: Nombre de bits par valeur (1 à 64)
+        count: Nombre de valeurs à extraire
+
+    Returns:
+        np.ndarray: Valeurs extraites (uint64)
+    """
+    if 32 % num_bits == 0:
+        return _unpack_aligned(words, num_bits, 32 // num_bits, count)
+
+    if num_bits > 32:
+        return _gather_bits(words, np.arange(count, dtype=np.uint64) * np.uint64(num_bits), num_bits)
+
+    values = np.empty(count, dtype=np.uint64)
+
+    def unpack_block(block: range):
+        for tile in _word_aligned_ranges(block, num_bits, _TILE_VALUES):
+            # Chaque tuile commence au début d'un mot: ses positions sont relatives à ce mot
+            first_word = tile.start * num_bits // 32
+            last_word = (tile.stop * num_bits + 31) // 32
+            start_bits = np.arange(len(tile), dtype=np.uint64) * np.uint64(num_bits)
+            values[tile.start:tile.stop] = _gather_bits(words[first_word:last_word], start_bits, num_bits)
+
+    _run_blocks(unpack_block, _parallel_blocks(count, num_bits))
+    return values
+
+
+def _gather_bits(words: np.ndarray, start_bits: np.ndarray, num_bits: int) -> np.ndarray:
+    """
+    Lit des champs de num_bits bits commençant aux positions start_bits.
+    Chaque valeur est lue dans la paire (mot courant, mot suivant) combinée
+    en 64 bits, ce qui couvre aussi les valeurs à cheval sur deux mots.
+
+    Args:
+        words: Mots 32-bit empaquetés
+        start_bits: Position du premier bit de chaque champ (uint64)
+        num_bits: Nombre de bits par valeur (1 à 64)
+
+    Returns:
+        np.ndarray: Valeurs lues (uint64)
+    """
+    # Plus de 32 bits: la valeur peut s'étendre sur trois mots, lue en deux
+    # champs comme l'écrit _pack_bits (32 bits bas, puis bits hauts)
+    if num_bits > 32:
+        low = _gather_bits(words, start_bits, 32)
+        high = _gather_bits(words, start_bits + np.uint64(32), num_bits - 32)
+        return low | (high << np.uint64(32))
+
+    word_index = (start_bits >> np.uint64(5)).astype(np.intp)
+    bit_offset = start_bits & np.uint64(31)
+
+    # Un mot nul de marge pour lire la paire du dernier mot
+    padded = np.zeros(len(words) + 1, dtype=np.uint64)
+    padded[:len(words)] = words
+    pairs = padded[word_index] | (padded[word_index + 1] << np.uint64(32))
+    return (pairs >> bit_offset) & np.uint64((1 << num_bits) - 1)
+
+
+def _pack_aligned(values: np.ndarray, num_bits: int, elements_per_word: int) -> np.ndarray:
+    """
+    Empaquète des valeurs sans chevauchement: elements_per_word valeurs par mot 32-bit.
+    Les valeurs sont vues comme une matrice (mots x éléments par mot), chaque
+    colonne est décalée de son offset puis les colonnes sont combinées par OU.
+
+    Args:
+        values: Valeurs à empaqueter (uint64, tenant sur num_bits bits)
+        num_bits: Nombre de bits par valeur (1 à 32)
+        elements_per_word: Nombre de valeurs par mot 32-bit
+
+    Returns:
+        np.ndarray: Mots 32-bit empaquetés (uint32)
+    """
+    num_words = (values.size + elements_per_word - 1) // elements_per_word
+
+    # Une valeur par mot (17 à 32 bits, dont 24): le mot est la valeur elle-même
+    if elements_per_word == 1:
+        return values.astype(np.uint32)
+
+    # Un bit par valeur (drapeaux, bitmaps): packbits regroupe 8 valeurs par octet en C
+    if num_bits == 1:
+        packed = np.packbits(values.astype(np.uint8), bitorder='little')
+        lanes = np.zeros(num_words * 4, dtype=np.uint8)
+        lanes[:packed.size] = packed
+        return lanes.view('<u4').astype(np.uint32)
+
+    # Largeurs d'octet entières: copie des octets bas, sans décalage ni masque
+    byte_width_dtype = _BYTE_WIDTH_DTYPES.get(num_bits)
+    if byte_width_dtype is not None:
+        lanes = np.zeros(num_words * elements_per_word, dtype=byte_width_dtype)
+        lanes[:values.size] = values
+        return lanes.view('<u4').astype(np.uint32)
+
+    # Compléter avec des zéros pour remplir le dernier mot
+    lanes = np.zeros(num_words * elements_per_word, dtype=np.uint64)
+    lanes[:values.size] = values
+    lanes = lanes.reshape(num_words, elements_per_word)
+
+    shifts = np.arange(elements_per_word, dtype=np.uint64) * np.uint64(num_bits)
+    return np.bitwise_or.reduce(lanes << shifts, axis=1).astype(np.uint32)
+
+
+def _unpack_aligned(words: np.ndarray, num_bits: int, elements_per_word: int, count: int) -> np.ndarray:
+    """
+    Extrait count valeurs empaquetées sans chevauchement par _pack_aligned.
+
+    Args:
+        words: Mots 32-bit empaquetés
+        num_bits: Nombre de bits par valeur (1 à 32)
+        elements_per_word: Nombre de valeurs par mot 32-bit
+        count: Nombre de valeurs à extraire
+
+    Returns:
+        np.ndarray: Valeurs extraites (uint64)
+    """
+    little_endian_words = words.astype('<u4', copy=False)
+
+    # Un bit par valeur: inverse de packbits sur les octets des mots
+    if num_bits == 1:
+        return np.unpackbits(little_endian_words.view(np.uint8), count=count,
+                             bitorder='little').astype(np.uint64)
+
+    # Largeurs d'octet entières: une simple vue suffit, sans décalage ni masque
+    byte_width_dtype = _BYTE_WIDTH_DTYPES.get(num_bits)
+    if byte_width_dtype is not None:
+        return little_endian_words.view(byte_width_dtype)[:count].astype(np.uint64)
+
+    shifts = np.arange(elements_per_word, dtype=np.uint64) * np.uint64(num_bits)
+    lanes = (words.astype(np.uint64)[:, None] >> shifts) & np.uint64((1 << num_bits) - 1)
+    return lanes.ravel()[:count]
 
 
 class BitPackingBase(ABC):
@@ -21,25 +308,25 @@ class BitPackingBase(ABC):
 
     def __init__(self):
         """Initialise les attributs communs à tous les compresseurs"""
-        self.compressed_data: List[int] = []  # Données compressées
+        self.compressed_data: np.ndarray = np.zeros(0, dtype=np.uint32)  # Mots 32-bit compressés
         self.original_length: int = 0  # Longueur du tableau original
         self.bits_per_element: int = 0  # Nombre de bits par élément
 
     @abstractmethod
-    def compress(self, array: List[int]) -> List[int]:
+    def compress(self, array: Sequence[int]) -> np.ndarray:
         """
         Compresse un tableau d'entiers.
 
         Args:
-            array: Tableau d'entiers à compresser
+            array: Tableau d'entiers à compresser (liste Python ou tableau NumPy)
 
         Returns:
-            List[int]: Tableau compressé
+            np.ndarray: Tableau compressé de mots 32-bit (uint32)
         """
         pass
 
     @abstractmethod
-    def decompress(self, compressed_array: List[int]) -> List[int]:
+    def decompress(self, compressed_array: np.ndarray) -> List[int]:
         """
         Décompresse et retourne le tableau original.
 
@@ -68,9 +355,24 @@ class BitPackingBase(ABC):
         """
         pass
 
-    def _calculate_bits_needed(self, array: List[int]) -> int:
+    @staticmethod
+    def _as_int_array(array: Sequence[int]) -> np.ndarray:
+        """
+        Convertit l'entrée en tableau NumPy int64, sans copie si c'en est déjà un.
+
+        Args:
+            array: Tableau d'entiers (liste Python ou tableau NumPy)
+
+        Returns:
+            np.ndarray: Tableau int64 contigu
+        """
+        return np.asarray(array, dtype=np.int64)
+
+    def _calculate_bits_needed(self, array: Sequence[int]) -> int:
         """
         Calcule le nombre minimum de bits nécessaires pour représenter toutes les valeurs.
+        Les extrêmes sont calculés en C sur un tableau NumPy (converti une seule
+        fois si l'entrée est une liste).
 
         Args:
             array: Tableau d'entiers à analyser
@@ -78,11 +380,12 @@ class BitPackingBase(ABC):
         Returns:
             int: Nombre de bits minimum nécessaires
         """
-        if not array:
+        values = self._as_int_array(array)
+        if values.size == 0:
             return 0
 
-        min_val = min(array)
-        max_val = max(array)
+        min_val = int(values.min())
+        max_val = int(values.max())
 
         # Si on a des nombres négatifs, on doit décaler toutes les valeurs
         if min_val < 0:
@@ -94,6 +397,72 @@ class BitPackingBase(ABC):
         # bit_length() retourne le nombre de bits nécessaires pour représenter le nombre
         return range_val.bit_length() if range_val > 0 else 1
 
+    def get_many(self, indices: Sequence[int]) -> np.ndarray:
+        """
+        Accès direct groupé à plusieurs éléments sans décompression complète.
+        Les sous-classes remplacent cette version générique par une lecture vectorisée.
+
+        Args:
+            indices: Index des éléments à récupérer (0-based)
+
+        Returns:
+            np.ndarray: Valeurs aux index spécifiés (int64)
+
+        Raises:
+            IndexError: Si un index est hors limites
+        """
+        return np.array([self.get(index) for index in self._check_indices(indices).tolist()],
+                        dtype=np.int64)
+
+    def _check_indices(self, indices: Sequence[int]) -> np.ndarray:
+        """
+        Convertit et valide un lot d'index pour get_many().
+
+        Args:
+            indices: Index à valider
+
+        Returns:
+            np.ndarray: Index sous forme de tableau int64
+
+        Raises:
+            IndexError: Si un index est hors limites
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        if indices.size and (int(indices.min()) < 0 or int(indices.max()) >= self.original_length):
+            raise IndexError("Index hors limites")
+        return indices
+
+    def _read_bits(self, array: np.ndarray, start_bit: int, mask: int) -> int:
+        """
+        Lit des bits depuis le tableau en commençant à start_bit.
+        Le mot courant et le suivant sont combinés dans un entier 64 bits: le
+        même chemin sert que la valeur soit dans un seul mot ou à cheval sur deux.
+        Un troisième mot n'est lu que pour les largeurs de plus de 32 bits.
+
+        Args:
+            array: Mots 32-bit depuis lesquels lire
+            start_bit: Position du bit de départ (0-based)
+            mask: Masque de la largeur à lire, précalculé par le compresseur
+
+        Returns:
+            int: Valeur lue
+        """
+        # Calculer l'index de l'entier et l'offset du bit
+        int_index = start_bit >> 5
+        bit_offset = start_bit & 31
+
+        if int_index >= len(array):
+            return 0
+
+        pair = int(array[int_index])
+        if int_index + 1 < len(array):
+            pair |= int(array[int_index + 1]) << 32
+            # Champ de plus de 64 - bit_offset bits (largeurs > 32): il touche un troisième mot
+            if mask >> (64 - bit_offset) and int_index + 2 < len(array):
+                pair |= int(array[int_index + 2]) << 64
+
+        return (pair >> bit_offset) & mask
+
 
 class SimpleBitPacking(BitPackingBase):
     """
@@ -105,7 +474,12 @@ class SimpleBitPacking(BitPackingBase):
     C'est le plus efficace en termes d'espace.
     """
 
-    def compress(self, array: List[int]) -> List[int]:
+    def __init__(self):
+        """Initialise le compresseur"""
+        super().__init__()
+        self._value_mask: int = 0  # Masque d'un élément, calculé une fois par compression
+
+    def compress(self, array: Sequence[int]) -> np.ndarray:
         """
         Compresse le tableau en utilisant le bit packing simple.
         Les entiers compressés peuvent s'étendre sur plusieurs entiers de sortie consécutifs.
@@ -114,10 +488,11 @@ class SimpleBitPacking(BitPackingBase):
             array: Tableau d'entiers positifs à compresser
 
         Returns:
-            List[int]: Tableau compressé avec utilisation optimale de l'espace
+            np.ndarray: Tableau compressé avec utilisation optimale de l'espace
         """
-        if not array:
-            return []
+        array = self._as_int_array(array)
+        if array.size == 0:
+            return np.zeros(0, dtype=np.uint32)
 
         self.original_length = len(array)
         self.bits_per_element = self._calculate_bits_needed(array)
@@ -127,18 +502,17 @@ class SimpleBitPacking(BitPackingBase):
         # Calculer le nombre d'entiers 32-bit nécessaires
         num_output_ints = (total_bits + 31) // 32
 
-        # Initialiser le tableau de sortie avec des zéros
-        compressed = [0] * num_output_ints
+        # Garantir que chaque valeur tient dans bits_per_element bits
+        self._value_mask = (1 << self.bits_per_element) - 1
+        values = array.astype(np.uint64) & np.uint64(self._value_mask)
 
-        # Empaqueter chaque élément dans le tableau compressé
-        for element_index, value in enumerate(array):
-            start_bit = element_index * self.bits_per_element
-            self._write_bits(compressed, start_bit, self.bits_per_element, value)
+        # Empaqueter tous les éléments en une seule passe vectorisée
+        compressed = _pack_bits(values, self.bits_per_element, num_output_ints)
 
         self.compressed_data = compressed
         return compressed
 
-    def decompress(self, compressed_array: List[int]) -> List[int]:
+    def decompress(self, compressed_array: np.ndarray) -> List[int]:
         """
         Décompresse le tableau en extrayant chaque valeur.
 
@@ -148,16 +522,12 @@ class SimpleBitPacking(BitPackingBase):
         Returns:
             List[int]: Tableau original reconstitué
         """
-        if not compressed_array:
+        if len(compressed_array) == 0:
             return []
 
-        result = []
-        for element_index in range(self.original_length):
-            start_bit = element_index * self.bits_per_element
-            value = self._read_bits(compressed_array, start_bit, self.bits_per_element)
-            result.append(value)
-
-        return result
+        # Extraire toutes les valeurs en une seule passe vectorisée
+        words = np.asarray(compressed_array, dtype=np.uint64)
+        return _unpack_bits(words, self.bits_per_element, self.original_length).tolist()
 
     def get(self, index: int) -> int:
         """
@@ -176,89 +546,24 @@ class SimpleBitPacking(BitPackingBase):
             raise IndexError("Index hors limites")
 
         start_bit = index * self.bits_per_element
-        return self._read_bits(self.compressed_data, start_bit, self.bits_per_element)
-
-    def _write_bits(self, array: List[int], start_bit: int, num_bits: int, value: int):
-        """
-        Écrit des bits dans le tableau en commençant à start_bit.
-        Peut s'étendre sur deux entiers consécutifs si nécessaire.
-
-        Args:
-            array: Tableau où écrire
-            start_bit: Position du bit de départ (0-based)
-            num_bits: Nombre de bits à écrire
-            value: Valeur à écrire
-        """
-        if num_bits == 0:
-            return
-
-        # Créer un masque pour garantir que la valeur tient dans num_bits
-        mask = (1 << num_bits) - 1
-        value &= mask  # Appliquer le masque
-
-        # Calculer dans quel entier 32-bit on écrit et à quel offset
-        int_index = start_bit // 32
-        bit_offset = start_bit % 32
-
-        # Si la valeur tient entièrement dans un seul entier
-        if bit_offset + num_bits <= 32:
-            array[int_index] |= (value << bit_offset)
-        else:
-            # Cas où on doit découper la valeur sur deux entiers
-            bits_in_first = 32 - bit_offset  # Bits qu'on peut mettre dans le premier
-            bits_in_second = num_bits - bits_in_first  # Reste à mettre dans le second
-
-            # Écrire la première partie (bits de poids faible)
-            first_mask = (1 << bits_in_first) - 1
-            array[int_index] |= ((value & first_mask) << bit_offset)
+        return self._read_bits(self.compressed_data, start_bit, self._value_mask)
 
-            # Écrire la seconde partie (bits de poids fort) si possible
-            if int_index + 1 < len(array):
-                array[int_index + 1] |= (value >> bits_in_first)
-
-    def _read_bits(self, array: List[int], start_bit: int, num_bits: int) -> int:
+    def get_many(self, indices: Sequence[int]) -> np.ndarray:
         """
-        Lit des bits depuis le tableau en commençant à start_bit.
-        Peut lire depuis deux entiers consécutifs si nécessaire.
+        Accès direct groupé: toutes les valeurs sont lues en une passe vectorisée.
 
         Args:
-            array: Tableau depuis lequel lire
-            start_bit: Position du bit de départ (0-based)
-            num_bits: Nombre de bits à lire
+            indices: Index des éléments (0-based)
 
         Returns:
-            int: Valeur lue
-        """
-        if num_bits == 0:
-            return 0
+            np.ndarray: Valeurs aux index spécifiés (int64)
 
-        # Calculer l'index de l'entier et l'offset du bit
-        int_index = start_bit // 32
-        bit_offset = start_bit % 32
-
-        if int_index >= len(array):
-            return 0
-
-        # Si la valeur est entièrement dans un seul entier
-        if bit_offset + num_bits <= 32:
-            mask = (1 << num_bits) - 1
-            return (array[int_index] >> bit_offset) & mask
-        else:
-            # Cas où la valeur est découpée sur deux entiers
-            bits_in_first = 32 - bit_offset
-            bits_in_second = num_bits - bits_in_first
-
-            # Lire la première partie
-            first_mask = (1 << bits_in_first) - 1
-            first_part = (array[int_index] >> bit_offset) & first_mask
-
-            # Lire la seconde partie si possible
-            if int_index + 1 < len(array):
-                second_mask = (1 << bits_in_second) - 1
-                second_part = array[int_index + 1] & second_mask
-                return first_part | (second_part << bits_in_first)
-            else:
-                return first_part
+        Raises:
+            IndexError: Si un index est hors limites
+        """
+        indices = self._check_indices(indices)
+        start_bits = indices.astype(np.uint64) * np.uint64(self.bits_per_element)
+        return _gather_bits(self.compressed_data, start_bits, self.bits_per_element).astype(np.int64)
 
 
 class AlignedBitPacking(BitPackingBase):
@@ -275,8 +580,13 @@ class AlignedBitPacking(BitPackingBase):
         """Initialise le compresseur avec support des nombres négatifs"""
         super().__init__()
         self.min_value = 0  # Stocke la valeur minimale pour l'offset
+        # Constantes dérivées de bits_per_element, calculées une fois par compression
+        self._elements_per_int: int = 32  # Éléments par entier 32-bit
+        self._value_mask: int = 0  # Masque d'un élément
+        # Versions NumPy typées pour les noyaux vectorisés (pas de promotion de type)
+        self._value_mask_u64 = np.uint64(0)
 
-    def compress(self, array: List[int]) -> List[int]:
+    def compress(self, array: Sequence[int]) -> np.ndarray:
         """
         Compresse le tableau en utilisant le bit packing aligné.
         Les entiers compressés ne s'étendent jamais sur plusieurs entiers de sortie.
@@ -285,44 +595,44 @@ class AlignedBitPacking(BitPackingBase):
             array: Tableau d'entiers (positifs, négatifs, ou mixtes) à compresser
 
         Returns:
-            List[int]: Tableau compressé avec alignement
+            np.ndarray: Tableau compressé avec alignement
         """
-        if not array:
-            return []
+        array = self._as_int_array(array)
+        if array.size == 0:
+            return np.zeros(0, dtype=np.uint32)
 
         self.original_length = len(array)
 
         # Calculer la valeur minimale pour l'offset
-        self.min_value = min(array)
+        self.min_value = int(array.min())
 
         # Appliquer le décalage pour tous les nombres
-        shifted_array = [value - self.min_value for value in array]
+        shifted_array = array - self.min_value
 
-        self.bits_per_element = self._calculate_bits_needed(shifted_array)
+        # Après décalage le minimum vaut 0: seule l'étendue détermine la largeur,
+        # sans nouveau parcours du tableau décalé
+        value_range = int(array.max()) - self.min_value
+        self.bits_per_element = value_range.bit_length() if value_range > 0 else 1
+        if self.bits_per_element > 32:
+            raise ValueError("Le packing aligné nécessite une étendue (max - min) de 32 bits au plus")
 
         # Calculer combien d'éléments peuvent tenir dans un entier 32-bit
-        elements_per_int = 32 // self.bits_per_element if self.bits_per_element > 0 else 32
-
-        # Calculer le nombre d'entiers de sortie nécessaires
-        num_output_ints = (self.original_length + elements_per_int - 1) // elements_per_int
-
-        # Initialiser le tableau de sortie
-        compressed = [0] * num_output_ints
-
-        # Empaqueter les éléments sans chevauchement
-        for i, value in enumerate(shifted_array):
-            output_index = i // elements_per_int  # Dans quel entier on écrit
-            element_index = i % elements_per_int  # Position dans cet entier
-            bit_offset = element_index * self.bits_per_element  # Offset en bits
-
-            compressed[output_index] |= (value << bit_offset)
-
-        # Stocker l'offset au début du tableau compressé
-        result = [self.min_value] + compressed
+        self._elements_per_int = 32 // self.bits_per_element
+        self._value_mask = (1 << self.bits_per_element) - 1
+        self._value_mask_u64 = np.uint64(self._value_mask)
+
+        # Empaqueter les éléments sans chevauchement, tous en une passe vectorisée
+        compressed = _pack_aligned(shifted_array.astype(np.uint64), self.bits_per_element, self._elements_per_int)
+
+        # Stocker l'offset au début du tableau compressé (complément à deux sur 64 bits:
+        # mot bas puis mot haut)
+        offset = self.min_value & 0xFFFFFFFFFFFFFFFF
+        header = np.array([offset & 0xFFFFFFFF, offset >> 32], dtype=np.uint32)
+        result = np.concatenate((header, compressed))
         self.compressed_data = result
         return result
 
-    def decompress(self, compressed_array: List[int]) -> List[int]:
+    def decompress(self, compressed_array: np.ndarray) -> List[int]:
         """
         Décompresse le tableau aligné en appliquant l'offset inverse.
 
@@ -332,30 +642,18 @@ class AlignedBitPacking(BitPackingBase):
         Returns:
             List[int]: Tableau original reconstitué
         """
-        if not compressed_array or len(compressed_array) < 2:
+        if len(compressed_array) < 3:
             return []
 
-        # Extraire l'offset du début du tableau
-        self.min_value = compressed_array[0]
-        actual_compressed = compressed_array[1:]
+        # Extraire l'offset (signé) des deux premiers mots du tableau
+        self.min_value = self._decode_offset(compressed_array[0], compressed_array[1])
+        actual_compressed = np.asarray(compressed_array[2:], dtype=np.uint32)
 
-        result = []
-        elements_per_int = 32 // self.bits_per_element if self.bits_per_element > 0 else 32
-        mask = (1 << self.bits_per_element) - 1
+        values = _unpack_aligned(actual_compressed, self.bits_per_element,
+                                 self._elements_per_int, self.original_length)
 
-        for i in range(self.original_length):
-            output_index = i // elements_per_int
-            element_index = i % elements_per_int
-            bit_offset = element_index * self.bits_per_element
-
-            if output_index < len(actual_compressed):
-                value = (actual_compressed[output_index] >> bit_offset) & mask
-                # Appliquer l'offset inverse
-                result.append(value + self.min_value)
-            else:
-                result.append(0)
-
-        return result
+        # Appliquer l'offset inverse
+        return (values.astype(np.int64) + self.min_value).tolist()
 
     def get(self, index: int) -> int:
         """
@@ -374,22 +672,54 @@ class AlignedBitPacking(BitPackingBase):
         if index < 0 or index >= self.original_length:
             raise IndexError("Index hors limites")
 
-        elements_per_int = 32 // self.bits_per_element if self.bits_per_element > 0 else 32
-        output_index = index // elements_per_int
-        element_index = index % elements_per_int
-        bit_offset = element_index * self.bits_per_element
-        mask = (1 << self.bits_per_element) - 1
+        output_index = index // self._elements_per_int
+        bit_offset = (index % self._elements_per_int) * self.bits_per_element
 
-        # Ignorer le premier élément qui contient l'offset
-        actual_compressed = self.compressed_data[1:]
+        # Ignorer les deux premiers mots qui contiennent l'offset
+        word_index = output_index + 2
 
-        if output_index < len(actual_compressed):
-            value = (actual_compressed[output_index] >> bit_offset) & mask
+        if word_index < len(self.compressed_data):
+            value = (int(self.compressed_data[word_index]) >> bit_offset) & self._value_mask
             # Appliquer l'offset inverse
             return value + self.min_value
         else:
             return 0
 
+    def get_many(self, indices: Sequence[int]) -> np.ndarray:
+        """
+        Accès direct groupé: un gather sur les mots puis un décalage par élément.
+
+        Args:
+            indices: Index des éléments (0-based)
+
+        Returns:
+            np.ndarray: Valeurs aux index spécifiés (int64)
+
+        Raises:
+            IndexError: Si un index est hors limites
+        """
+        indices = self._check_indices(indices)
+        # +2: ignorer les deux premiers mots qui contiennent l'offset
+        words = self.compressed_data[indices // self._elements_per_int + 2].astype(np.uint64)
+        bit_offsets = ((indices % self._elements_per_int) * self.bits_per_element).astype(np.uint64)
+        values = (words >> bit_offsets) & self._value_mask_u64
+        return values.astype(np.int64) + self.min_value
+
+    @staticmethod
+    def _decode_offset(low_word: int, high_word: int) -> int:
+        """
+        Décode l'offset stocké en complément à deux sur les deux premiers mots 32-bit.
+
+        Args:
+            low_word: Premier mot du tableau compressé (32 bits bas)
+            high_word: Deuxième mot du tableau compressé (32 bits hauts)
+
+        Returns:
+            int: Valeur minimale signée
+        """
+        offset = int(low_word) | (int(high_word) << 32)
+        return offset - (1 << 64) if offset >= (1 << 63) else offset
+
 
 class OverflowBitPacking(BitPackingBase):
     """
@@ -411,8 +741,22 @@ class OverflowBitPacking(BitPackingBase):
         self.main_bits: int = 0  # Bits pour les valeurs normales
         self.has_overflow_bit: bool = False  # Si on utilise un bit d'overflow
         self.threshold_value: int = 0  # Seuil pour décider si une valeur va en overflow
-
-    def compress(self, array: List[int]) -> List[int]:
+        # Vues sans copie sur les deux zones de compressed_data
+        self.main_buffer: np.ndarray = np.zeros(0, dtype=np.uint32)  # Valeurs principales empaquetées
+        self.overflow_buffer: np.ndarray = np.zeros(0, dtype=np.uint32)  # Zone d'overflow
+        self.overflow_words: int = 1  # Mots par valeur overflow (2 si un outlier dépasse 32 bits)
+        # Constantes de décodage, calculées une fois par compression
+        self._total_bits_per_element: int = 0  # Bits par élément, bit d'overflow compris
+        self._element_mask: int = 0  # Masque d'un élément encodé, bit d'overflow compris
+        self._num_main_ints: int = 0  # Nombre de mots de la zone principale
+        self._value_mask: int = 0  # Masque de la valeur (ou de l'index overflow)
+        self._overflow_mask: int = 0  # Masque du bit d'overflow (0 si pas d'overflow)
+        # Versions NumPy typées pour les noyaux vectorisés (pas de promotion de type)
+        self._value_mask_u64 = np.uint64(0)
+        self._main_bits_u64 = np.uint64(0)
+        self._total_bits_u64 = np.uint64(0)
+
+    def compress(self, array: Sequence[int]) -> np.ndarray:
         """
         Compresse le tableau en utilisant le bit packing avec overflow.
         Les outliers sont stockés dans une zone de débordement séparée.
@@ -421,53 +765,65 @@ class OverflowBitPacking(BitPackingBase):
             array: Tableau d'entiers positifs à compresser
 
         Returns:
-            List[int]: Tableau compressé suivi de la zone d'overflow
+            np.ndarray: Tableau compressé suivi de la zone d'overflow
         """
-        if not array:
-            return []
+        array = self._as_int_array(array)
+        if array.size == 0:
+            return np.zeros(0, dtype=np.uint32)
 
         self.original_length = len(array)
 
         # Analyser les données pour déterminer la stratégie d'overflow optimale
         self._analyze_overflow_strategy(array)
 
-        # Séparer les valeurs normales et les valeurs overflow
-        main_values = []
-        self.overflow_data = []
-        overflow_map = {}  # Mapping valeur -> index dans overflow
-
-        for value in array:
-            if self._needs_overflow(value):
-                # Cette valeur doit aller en overflow
-                if value not in overflow_map:
-                    # Nouvelle valeur overflow, l'ajouter
-                    overflow_map[value] = len(self.overflow_data)
-                    self.overflow_data.append(value)
-                # Encoder avec le bit d'overflow + position dans overflow
-                encoded_value = (1 << self.main_bits) | overflow_map[value]
-                main_values.append(encoded_value)
-            else:
-                # Encodage direct
-                main_values.append(value)
+        # Séparer les valeurs normales et les valeurs overflow en une passe vectorisée
+        overflow_mask = self._needs_overflow(array)
+        # Valeurs overflow distinctes (triées) et position de chaque outlier parmi elles
+        overflow_values, overflow_indices = np.unique(array[overflow_mask], return_inverse=True)
+        self.overflow_data = overflow_values.tolist()
 
-        # Compresser les valeurs principales en utilisant simple bit packing
-        total_bits_per_element = self.main_bits + (1 if self.has_overflow_bit else 0)
-        total_bits = len(main_values) * total_bits_per_element
-        num_output_ints = (total_bits + 31) // 32
+        # Encoder les outliers avec le bit d'overflow + position dans overflow,
+        # les autres valeurs sont encodées directement
+        main_values = array.astype(np.uint64)
+        main_values[overflow_mask] = np.uint64(1 << self.main_bits) | overflow_indices.astype(np.uint64)
 
-        compressed = [0] * num_output_ints
+        # Compresser les valeurs principales en utilisant simple bit packing
+        self._cache_layout()
+        total_bits_per_element = self._total_bits_per_element
 
-        for i, value in enumerate(main_values):
-            start_bit = i * total_bits_per_element
-            self._write_bits(compressed, start_bit, total_bits_per_element, value)
+        values = main_values & np.uint64(self._element_mask)
+        packed = _pack_bits(values, total_bits_per_element, self._num_main_ints)
 
-        # Ajouter les données overflow à la fin
-        compressed.extend(self.overflow_data)
+        # Ajouter les données overflow à la fin: un mot par valeur, ou deux
+        # (32 bits bas puis hauts) si un outlier ne tient pas sur 32 bits
+        overflow_values = overflow_values.astype(np.uint64)
+        self.overflow_words = 2 if overflow_values.size and int(overflow_values[-1]) > 0xFFFFFFFF else 1
+        if self.overflow_words == 2:
+            overflow_values = np.stack((overflow_values & np.uint64(0xFFFFFFFF),
+                                        overflow_values >> np.uint64(32)), axis=1).ravel()
+        compressed = np.concatenate((packed, overflow_values.astype(np.uint32)))
 
         self.compressed_data = compressed
+        self.main_buffer = compressed[:self._num_main_ints]
+        self.overflow_buffer = compressed[self._num_main_ints:]
         return compressed
 
-    def _analyze_overflow_strategy(self, array: List[int]):
+    def _cache_layout(self):
+        """
+        Précalcule les constantes de disposition utilisées par decompress() et get()
+        à partir de la stratégie d'overflow et de la longueur originale.
+        """
+        self._total_bits_per_element = self.main_bits + (1 if self.has_overflow_bit else 0)
+        self._element_mask = (1 << self._total_bits_per_element) - 1
+        total_bits = self.original_length * self._total_bits_per_element
+        self._num_main_ints = (total_bits + 31) // 32
+        self._value_mask = (1 << self.main_bits) - 1
+        self._overflow_mask = 1 << self.main_bits if self.has_overflow_bit else 0
+        self._value_mask_u64 = np.uint64(self._value_mask)
+        self._main_bits_u64 = np.uint64(self.main_bits)
+        self._total_bits_u64 = np.uint64(self._total_bits_per_element)
+
+    def _analyze_overflow_strategy(self, array: np.ndarray):
         """
         Analyse les valeurs pour déterminer la stratégie d'overflow optimale.
         Décide combien de bits utiliser pour les valeurs normales et si on
@@ -476,55 +832,60 @@ class OverflowBitPacking(BitPackingBase):
         Args:
             array: Tableau à analyser
         """
-        if not array:
+        if array.size == 0:
             self.has_overflow_bit = False
             self.main_bits = 1
             self.overflow_bits = 0
             self.threshold_value = 0
             return
 
-        sorted_values = sorted(set(array))
+        # Valeurs uniques triées, en une seule passe NumPy
+        sorted_values = np.unique(array)
 
         if len(sorted_values) <= 1:
             # Cas simple: toutes les valeurs sont identiques
             self.has_overflow_bit = False
             self.main_bits = self._calculate_bits_needed(array)
             self.overflow_bits = 0
-            self.threshold_value = max(array) if array else 0
+            self.threshold_value = int(sorted_values[-1])
             return
 
         # Stratégie basée sur un seuil
         # Les valeurs nécessitant plus de 60% des bits max vont en overflow
-        max_bits = max(sorted_values).bit_length()
+        max_bits = int(sorted_values[-1]).bit_length()
         threshold_bits = max(3, int(max_bits * 0.6))
         self.threshold_value = (1 << threshold_bits) - 1
 
-        overflow_values = [v for v in sorted_values if v > self.threshold_value]
+        # Nombre de valeurs uniques au-dessus du seuil, sans construire de liste
+        num_overflow = len(sorted_values) - int(np.searchsorted(sorted_values, self.threshold_value, side='right'))
 
         # Utiliser overflow seulement si < 30% des valeurs uniques sont des outliers
-        if len(overflow_values) > 0 and len(overflow_values) < len(sorted_values) * 0.3:
+        if num_overflow > 0 and num_overflow < len(sorted_values) * 0.3:
             self.has_overflow_bit = True
             self.main_bits = threshold_bits
-            self.overflow_bits = math.ceil(math.log2(len(overflow_values) + 1)) if len(overflow_values) > 1 else 1
+            # ceil(log2(n + 1)) == n.bit_length() pour n >= 1, sans passer par les flottants
+            self.overflow_bits = num_overflow.bit_length()
         else:
             # Pas assez d'outliers pour justifier l'overflow
             self.has_overflow_bit = False
             self.main_bits = max_bits
             self.overflow_bits = 0
 
-    def _needs_overflow(self, value: int) -> bool:
+    def _needs_overflow(self, values: np.ndarray) -> np.ndarray:
         """
-        Vérifie si une valeur doit aller dans la zone d'overflow.
+        Vérifie quelles valeurs doivent aller dans la zone d'overflow.
 
         Args:
-            value: Valeur à vérifier
+            values: Valeurs à vérifier
 
         Returns:
-            bool: True si la valeur dépasse le seuil
+            np.ndarray: Masque booléen, True pour les valeurs qui dépassent le seuil
         """
-        return self.has_overflow_bit and value > self.threshold_value
+        if not self.has_overflow_bit:
+            return np.zeros(values.shape, dtype=bool)
+        return values > self.threshold_value
 
-    def decompress(self, compressed_array: List[int]) -> List[int]:
+    def decompress(self, compressed_array: np.ndarray) -> List[int]:
         """
         Décompresse le tableau avec gestion de l'overflow.
 
@@ -534,36 +895,41 @@ class OverflowBitPacking(BitPackingBase):
         Returns:
             List[int]: Tableau original reconstitué
         """
-        if not compressed_array:
+        if len(compressed_array) == 0:
             return []
 
-        # Séparer les données compressées et les données overflow
-        total_bits_per_element = self.main_bits + (1 if self.has_overflow_bit else 0)
-        total_bits = self.original_length * total_bits_per_element
-        num_main_ints = (total_bits + 31) // 32
-
-        main_compressed = compressed_array[:num_main_ints]
-        overflow_data = compressed_array[num_main_ints:]
-
-        result = []
-        overflow_mask = 1 << self.main_bits if self.has_overflow_bit else 0
-        value_mask = (1 << self.main_bits) - 1
-
-        for i in range(self.original_length):
-            start_bit = i * total_bits_per_element
-            encoded_value = self._read_bits(main_compressed, start_bit, total_bits_per_element)
-
-            if self.has_overflow_bit and (encoded_value & overflow_mask):
-                # Ceci est une référence overflow
-                overflow_index = encoded_value & value_mask
-                if overflow_index < len(overflow_data):
-                    actual_value = overflow_data[overflow_index]
-                    result.append(actual_value)
-                else:
-                    result.append(0)
-            else:
-                # Valeur directe
-                result.append(encoded_value & value_mask)
+        # Séparer les données compressées et les données overflow (vues, sans copie)
+        compressed_array = np.asarray(compressed_array, dtype=np.uint32)
+        main_compressed = compressed_array[:self._num_main_ints]
+        overflow_data = compressed_array[self._num_main_ints:]
+
+        encoded_values = _unpack_bits(main_compressed, self._total_bits_per_element, self.original_length)
+        return self._decode_values(encoded_values, overflow_data).tolist()
+
+    def _decode_values(self, encoded_values: np.ndarray, overflow_data: np.ndarray) -> np.ndarray:
+        """
+        Décode un lot de valeurs encodées: valeurs directes ou références overflow.
+
+        Args:
+            encoded_values: Valeurs lues dans la zone principale (uint64)
+            overflow_data: Zone d'overflow
+
+        Returns:
+            np.ndarray: Valeurs originales (uint64)
+        """
+        result = encoded_values & self._value_mask_u64
+
+        if self.has_overflow_bit:
+            # Remplacer les références overflow par les valeurs de la zone overflow
+            is_reference = (encoded_values >> self._main_bits_u64) != 0
+            overflow_table = overflow_data.astype(np.uint64)
+            if self.overflow_words == 2:
+                overflow_table = overflow_table[0::2] | (overflow_table[1::2] << np.uint64(32))
+            # Un zéro en fin de table pour les références hors limites
+            num_overflow = len(overflow_table)
+            overflow_table = np.append(overflow_table, np.uint64(0))
+            references = np.minimum(result[is_reference], num_overflow).astype(np.intp)
+            result[is_reference] = overflow_table[references]
 
         return result
 
@@ -583,78 +949,42 @@ class OverflowBitPacking(BitPackingBase):
         if index < 0 or index >= self.original_length:
             raise IndexError("Index hors limites")
 
-        total_bits_per_element = self.main_bits + (1 if self.has_overflow_bit else 0)
-        total_bits = self.original_length * total_bits_per_element
-        num_main_ints = (total_bits + 31) // 32
-
-        start_bit = index * total_bits_per_element
-        encoded_value = self._read_bits(self.compressed_data[:num_main_ints], start_bit, total_bits_per_element)
+        start_bit = index * self._total_bits_per_element
+        encoded_value = self._read_bits(self.main_buffer, start_bit, self._element_mask)
 
-        overflow_mask = 1 << self.main_bits if self.has_overflow_bit else 0
-        value_mask = (1 << self.main_bits) - 1
-
-        if self.has_overflow_bit and (encoded_value & overflow_mask):
+        if encoded_value & self._overflow_mask:
             # Référence overflow - récupérer depuis la zone overflow
-            overflow_index = encoded_value & value_mask
-            overflow_start = num_main_ints
-            if overflow_start + overflow_index < len(self.compressed_data):
-                return self.compressed_data[overflow_start + overflow_index]
+            overflow_index = encoded_value & self._value_mask
+            if self.overflow_words == 2:
+                position = 2 * overflow_index
+                if position + 1 < len(self.overflow_buffer):
+                    return int(self.overflow_buffer[position]) | (int(self.overflow_buffer[position + 1]) << 32)
+                return 0
+            if overflow_index < len(self.overflow_buffer):
+                return int(self.overflow_buffer[overflow_index])
             else:
                 return 0
         else:
             # Valeur directe
-            return encoded_value & value_mask
-
-    def _write_bits(self, array: List[int], start_bit: int, num_bits: int, value: int):
-        """Écrit des bits - implémentation identique à SimpleBitPacking"""
-        if num_bits == 0:
-            return
-
-        mask = (1 << num_bits) - 1
-        value &= mask
-
-        int_index = start_bit // 32
-        bit_offset = start_bit % 32
-
-        if int_index >= len(array):
-            return
-
-        if bit_offset + num_bits <= 32:
-            array[int_index] |= (value << bit_offset)
-        else:
-            bits_in_first = 32 - bit_offset
-            first_mask = (1 << bits_in_first) - 1
-            array[int_index] |= ((value & first_mask) << bit_offset)
-            if int_index + 1 < len(array):
-                array[int_index + 1] |= (value >> bits_in_first)
-
-    def _read_bits(self, array: List[int], start_bit: int, num_bits: int) -> int:
-        """Lit des bits - implémentation identique à SimpleBitPacking"""
-        if num_bits == 0:
-            return 0
-
-        int_index = start_bit // 32
-        bit_offset = start_bit % 32
+            return encoded_value & self._value_mask
 
-        if int_index >= len(array):
-            return 0
+    def get_many(self, indices: Sequence[int]) -> np.ndarray:
+        """
+        Accès direct groupé avec gestion de l'overflow, en une passe vectorisée.
 
-        if bit_offset + num_bits <= 32:
-            mask = (1 << num_bits) - 1
-            return (array[int_index] >> bit_offset) & mask
-        else:
-            bits_in_first = 32 - bit_offset
-            bits_in_second = num_bits - bits_in_first
+        Args:
+            indices: Index des éléments (0-based)
 
-            first_mask = (1 << bits_in_first) - 1
-            first_part = (array[int_index] >> bit_offset) & first_mask
+        Returns:
+            np.ndarray: Valeurs aux index spécifiés (int64)
 
-            if int_index + 1 < len(array):
-                second_mask = (1 << bits_in_second) - 1
-                second_part = array[int_index + 1] & second_mask
-                return first_part | (second_part << bits_in_first)
-            else:
-                return first_part
+        Raises:
+            IndexError: Si un index est hors limites
+        """
+        indices = self._check_indices(indices)
+        start_bits = indices.astype(np.uint64) * self._total_bits_u64
+        encoded_values = _gather_bits(self.main_buffer, start_bits, self._total_bits_per_element)
+        return self._decode_values(encoded_values, self.overflow_buffer).astype(np.int64)
 
 
 class ZigZagBitPacking(SimpleBitPacking):
@@ -669,16 +999,37 @@ class ZigZagBitPacking(SimpleBitPacking):
     """
 
     @staticmethod
-    def _zigzag_encode(value: int) -> int:
-        """Encode un entier signé en non-signé avec Zig-Zag."""
-        return (value << 1) ^ (value >> 31)
+    def _zigzag_encode(value):
+        """Encode un entier signé en non-signé avec Zig-Zag (int ou tableau int64)."""
+        # >> 63: le masque de signe reste correct sur toute la plage int64
+        return (value << 1) ^ (value >> 63)
 
     @staticmethod
-    def _zigzag_decode(value: int) -> int:
-        """Decode un entier non-signé en signé avec Zig-Zag inverse."""
+    def _zigzag_decode(value):
+        """Decode un entier non-signé en signé avec Zig-Zag inverse (int ou tableau uint64)."""
+        if isinstance(value, np.ndarray):
+            # Décalage logique en uint64 (les codes >= 2**63 ne doivent pas propager
+            # de bit de signe), puis relecture des bits en int64
+            return ((value >> np.uint64(1)) ^ (np.uint64(0) - (value & np.uint64(1)))).view(np.int64)
         return (value >> 1) ^ (-(value & 1))
 
-    def compress(self, array: List[int]) -> List[int]:
+    def _calculate_bits_needed(self, array: Sequence[int]) -> int:
+        """
+        Calcule le nombre de bits des codes ZigZag, lus comme non signés:
+        le code de -2**63 (2**64 - 1) apparaît comme -1 dans un tableau int64.
+
+        Args:
+            array: Codes ZigZag (int64)
+
+        Returns:
+            int: Nombre de bits minimum nécessaires
+        """
+        values = self._as_int_array(array).view(np.uint64)
+        if values.size == 0:
+            return 0
+        return int(values.max()).bit_length() or 1
+
+    def compress(self, array: Sequence[int]) -> np.ndarray:
         """
         Compresse le tableau en utilisant le bit packing avec codage ZigZag.
 
@@ -686,18 +1037,19 @@ class ZigZagBitPacking(SimpleBitPacking):
             array: Tableau d'entiers (positifs et négatifs) à compresser
 
         Returns:
-            List[int]: Tableau compressé avec codage ZigZag
+            np.ndarray: Tableau compressé avec codage ZigZag
         """
-        if not array:
-            return []
+        array = self._as_int_array(array)
+        if array.size == 0:
+            return np.zeros(0, dtype=np.uint32)
 
-        # Appliquer le codage ZigZag
-        zigzag_encoded = [self._zigzag_encode(value) for value in array]
+        # Appliquer le codage ZigZag sur tout le tableau
+        zigzag_encoded = self._zigzag_encode(array)
 
         # Utiliser le bit packing simple sur les données ZigZag codées
         return super().compress(zigzag_encoded)
 
-    def decompress(self, compressed_array: List[int]) -> List[int]:
+    def decompress(self, compressed_array: np.ndarray) -> List[int]:
         """
         Décompresse le tableau en appliquant le décodage ZigZag inverse.
 
@@ -707,14 +1059,15 @@ class ZigZagBitPacking(SimpleBitPacking):
         Returns:
             List[int]: Tableau original (avec signes restaurés)
         """
-        if not compressed_array:
+        if len(compressed_array) == 0:
             return []
 
-        # Utiliser le décompressage simple
-        zigzag_decoded = super().decompress(compressed_array)
+        # Extraire les valeurs codées sans passer par une liste intermédiaire
+        words = np.asarray(compressed_array, dtype=np.uint64)
+        encoded_values = _unpack_bits(words, self.bits_per_element, self.original_length)
 
-        # Appliquer le décodage ZigZag inverse
-        return [self._zigzag_decode(value) for value in zigzag_decoded]
+        # Appliquer le décodage ZigZag inverse sur tout le tableau
+        return self._zigzag_decode(encoded_values).tolist()
 
     def get(self, index: int) -> int:
         """
@@ -737,3 +1090,21 @@ class ZigZagBitPacking(SimpleBitPacking):
 
         # Appliquer le décodage ZigZag inverse
         return self._zigzag_decode(encoded_value)
+
+    def get_many(self, indices: Sequence[int]) -> np.ndarray:
+        """
+        Accès direct groupé avec décodage ZigZag vectorisé.
+
+        Args:
+            indices: Index des éléments (0-based)
+
+        Returns:
+            np.ndarray: Valeurs aux index spécifiés (int64, avec signe)
+
+        Raises:
+            IndexError: Si un index est hors limites
+        """
+        indices = self._check_indices(indices)
+        start_bits = indices.astype(np.uint64) * np.uint64(self.bits_per_element)
+        encoded_values = _gather_bits(self.compressed_data, start_bits, self.bits_per_element)
+        return self._zigzag_decode(encoded_values)
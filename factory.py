@@ -8,7 +8,7 @@ la création et le changement d'algorithmes sans modifier le code client.
 """
 
 from enum import Enum
-from typing import Union
+from typing import Dict, List, Sequence, Tuple, Type, Union
 from bit_packing import BitPackingBase, SimpleBitPacking, AlignedBitPacking, OverflowBitPacking, ZigZagBitPacking
 
 
@@ -19,6 +19,55 @@ class CompressionType(Enum):
     OVERFLOW = "overflow"
     ZIGZAG = "zigzag"
 
+    # Les membres sont des singletons comparés par identité: le hash d'identité
+    # (en C) est cohérent et évite Enum.__hash__, écrit en Python, à chaque
+    # recherche dans les tables de la factory
+    __hash__ = object.__hash__
+
+
+# Type de compression par nom (les noms sont les valeurs de l'énumération, en minuscules)
+_TYPES_BY_NAME: Dict[str, CompressionType] = {t.value: t for t in CompressionType}
+
+# Noms des types disponibles, calculés une fois à l'import
+_AVAILABLE_TYPES: Tuple[str, ...] = tuple(_TYPES_BY_NAME)
+
+# Classe d'implémentation de chaque type de compression
+_COMPRESSOR_CLASSES: Dict[CompressionType, Type[BitPackingBase]] = {
+    CompressionType.SIMPLE: SimpleBitPacking,
+    CompressionType.ALIGNED: AlignedBitPacking,
+    CompressionType.OVERFLOW: OverflowBitPacking,
+    CompressionType.ZIGZAG: ZigZagBitPacking,
+}
+
+# Description de chaque type de compression, pour l'interface et les rapports
+_DESCRIPTIONS: Dict[CompressionType, str] = {
+    CompressionType.SIMPLE:
+        "Bit packing simple qui permet aux entiers compressés de s'étendre sur "
+        "plusieurs entiers consécutifs dans le tableau de sortie. Le plus efficace "
+        "en termes d'espace mais les opérations de bits sont légèrement plus complexes. "
+        "Pour les données positives uniquement.",
+
+    CompressionType.ALIGNED:
+        "Bit packing aligné qui garantit que les entiers compressés ne s'étendent "
+        "jamais sur plusieurs entiers consécutifs. Accès plus rapide mais peut "
+        "utiliser plus d'espace à cause des contraintes d'alignement. "
+        "Pour les données positives uniquement.",
+
+    CompressionType.OVERFLOW:
+        "Bit packing avec overflow qui gère efficacement les outliers en stockant "
+        "les grandes valeurs dans une zone de débordement séparée. Optimal pour les "
+        "jeux de données avec principalement de petites valeurs et quelques grandes outliers. "
+        "Pour les données positives uniquement.",
+
+    CompressionType.ZIGZAG:
+        "Compression ZigZag qui encode les entiers en utilisant un motif en zigzag. "
+        "Seul algorithme supportant les nombres négatifs. Utile pour les données où les "
+        "valeurs positives et négatives sont également probables.",
+}
+
+# Instances partagées par type, créées à la première demande avec shared=True
+_SHARED_COMPRESSORS: Dict[CompressionType, BitPackingBase] = {}
+
 
 class BitPackingFactory:
     """
@@ -28,8 +77,13 @@ class BitPackingFactory:
     basée sur un seul paramètre, suivant le pattern de conception Factory.
     """
 
+    # Classe utilisée uniquement via ses méthodes statiques: aucune instance
+    # ne doit porter de __dict__
+    __slots__ = ()
+
     @staticmethod
-    def create_compressor(compression_type: Union[str, CompressionType]) -> BitPackingBase:
+    def create_compressor(compression_type: Union[str, CompressionType],
+                          shared: bool = False) -> BitPackingBase:
         """
         Crée un compresseur bit packing basé sur le type spécifié.
 
@@ -39,6 +93,9 @@ class BitPackingFactory:
                 - "aligned" ou CompressionType.ALIGNED: Bit packing aligné (pas de chevauchement)
                 - "overflow" ou CompressionType.OVERFLOW: Bit packing avec overflow (gestion des outliers)
                 - "zigzag" ou CompressionType.ZIGZAG: Bit packing avec ZigZag (données mixtes)
+            shared: Si True, retourne une instance unique par type, réutilisée à chaque
+                appel. Les compresseurs gardent l'état de leur dernière compression:
+                réservé aux appelants qui compressent un tableau après l'autre.
 
         Returns:
             BitPackingBase: Instance de l'algorithme de compression demandé
@@ -48,23 +105,51 @@ class BitPackingFactory:
         """
         # Convertir la chaîne en enum si nécessaire
         if isinstance(compression_type, str):
-            try:
-                compression_type = CompressionType(compression_type.lower())
-            except ValueError:
-                raise ValueError(f"Type de compression inconnu: {compression_type}. "
-                               f"Types disponibles: {[t.value for t in CompressionType]}")
+            compression_type = _parse_compression_type(compression_type)
+
+        if shared:
+            compressor = _SHARED_COMPRESSORS.get(compression_type)
+            if compressor is None:
+                compressor = BitPackingFactory.create_compressor(compression_type)
+                _SHARED_COMPRESSORS[compression_type] = compressor
+            return compressor
 
         # Créer et retourner le compresseur approprié
-        if compression_type == CompressionType.SIMPLE:
-            return SimpleBitPacking()
-        elif compression_type == CompressionType.ALIGNED:
-            return AlignedBitPacking()
-        elif compression_type == CompressionType.OVERFLOW:
-            return OverflowBitPacking()
-        elif compression_type == CompressionType.ZIGZAG:
-            return ZigZagBitPacking()
-        else:
-            raise ValueError(f"Type de compression non supporté: {compression_type}")
+        return _compressor_class(compression_type)()
+
+    @staticmethod
+    def create_compressors(compression_types: Sequence[Union[str, CompressionType]],
+                           shared: bool = False) -> List[BitPackingBase]:
+        """
+        Crée un compresseur pour chaque type d'une séquence (par exemple un par bloc).
+        Chaque type distinct n'est résolu qu'une fois pour tout le lot.
+
+        Args:
+            compression_types: Types de compression à créer, dans l'ordre voulu
+            shared: Si True, les compresseurs retournés sont les instances partagées
+                (voir create_compressor): un même objet pour tous les blocs d'un type
+
+        Returns:
+            List[BitPackingBase]: Un compresseur par type demandé, dans le même ordre
+
+        Raises:
+            ValueError: Si un des types n'est pas reconnu
+        """
+        # Instance partagée ou classe à instancier, par type tel que demandé
+        resolved = {}
+        for compression_type in compression_types:
+            if compression_type in resolved:
+                continue
+            if shared:
+                resolved[compression_type] = BitPackingFactory.create_compressor(compression_type, shared=True)
+            elif isinstance(compression_type, str):
+                resolved[compression_type] = _compressor_class(_parse_compression_type(compression_type))
+            else:
+                resolved[compression_type] = _compressor_class(compression_type)
+
+        if shared:
+            return [resolved[compression_type] for compression_type in compression_types]
+        return [resolved[compression_type]() for compression_type in compression_types]
 
     @staticmethod
     def get_available_types() -> list:
@@ -74,7 +159,8 @@ class BitPackingFactory:
         Returns:
             list: Liste des chaînes de types de compression disponibles
         """
-        return [compression_type.value for compression_type in CompressionType]
+        # Copie: l'appelant peut modifier la liste sans affecter la factory
+        return list(_AVAILABLE_TYPES)
 
     @staticmethod
     def get_description(compression_type: Union[str, CompressionType]) -> str:
@@ -88,45 +174,58 @@ class BitPackingFactory:
             str: Description de l'algorithme de compression
         """
         if isinstance(compression_type, str):
-            compression_type = CompressionType(compression_type.lower())
-
-        descriptions = {
-            CompressionType.SIMPLE:
-                "Bit packing simple qui permet aux entiers compressés de s'étendre sur "
-                "plusieurs entiers consécutifs dans le tableau de sortie. Le plus efficace "
-                "en termes d'espace mais les opérations de bits sont légèrement plus complexes. "
-                "Pour les données positives uniquement.",
-
-            CompressionType.ALIGNED:
-                "Bit packing aligné qui garantit que les entiers compressés ne s'étendent "
-                "jamais sur plusieurs entiers consécutifs. Accès plus rapide mais peut "
-                "utiliser plus d'espace à cause des contraintes d'alignement. "
-                "Pour les données positives uniquement.",
-
-            CompressionType.OVERFLOW:
-                "Bit packing avec overflow qui gère efficacement les outliers en stockant "
-                "les grandes valeurs dans une zone de débordement séparée. Optimal pour les "
-                "jeux de données avec principalement de petites valeurs et quelques grandes outliers. "
-                "Pour les données positives uniquement.",
-
-            CompressionType.ZIGZAG:
-                "Compression ZigZag qui encode les entiers en utilisant un motif en zigzag. "
-                "Seul algorithme supportant les nombres négatifs. Utile pour les données où les "
-                "valeurs positives et négatives sont également probables.",
-        }
-
-        return descriptions.get(compression_type, "Type de compression inconnu")
-
-
-# Fonction de commodité pour un accès facile
-def create_compressor(compression_type: Union[str, CompressionType]) -> BitPackingBase:
+            compression_type = _parse_compression_type(compression_type)
+
+        return _DESCRIPTIONS.get(compression_type, "Type de compression inconnu")
+
+
+def _parse_compression_type(name: str) -> CompressionType:
     """
-    Fonction de commodité pour créer un compresseur sans instancier la factory.
+    Convertit un nom de type de compression en CompressionType.
+    Le cas courant (nom déjà en minuscules) se résout en une seule recherche;
+    lower() n'est appelé qu'en cas d'échec.
 
     Args:
-        compression_type: Type de compression à créer
+        name: Nom du type, insensible à la casse
 
     Returns:
-        BitPackingBase: Instance de l'algorithme de compression demandé
+        CompressionType: Type correspondant
+
+    Raises:
+        ValueError: Si le nom n'est pas reconnu
+    """
+    compression_type = _TYPES_BY_NAME.get(name)
+    if compression_type is None:
+        compression_type = _TYPES_BY_NAME.get(name.lower())
+        if compression_type is None:
+            raise ValueError(f"Type de compression inconnu: {name}. "
+                             f"Types disponibles: {list(_AVAILABLE_TYPES)}")
+    return compression_type
+
+
+def _compressor_class(compression_type: CompressionType) -> Type[BitPackingBase]:
+    """
+    Retourne la classe d'implémentation d'un type de compression.
+
+    Args:
+        compression_type: Type de compression
+
+    Returns:
+        Type[BitPackingBase]: Classe du compresseur
+
+    Raises:
+        ValueError: Si le type n'est pas supporté
     """
-    return BitPackingFactory.create_compressor(compression_type)
+    compressor_class = _COMPRESSOR_CLASSES.get(compression_type)
+    if compressor_class is None:
+        raise ValueError(f"Type de compression non supporté: {compression_type}")
+    return compressor_class
+
+
+# Fonctions de commodité pour un accès facile, sans passer par la classe.
+# Les méthodes statiques sont de simples fonctions: elles sont exposées telles
+# quelles, sans appel intermédiaire.
+create_compressor = BitPackingFactory.create_compressor
+create_compressors = BitPackingFactory.create_compressors
+get_available_types = BitPackingFactory.get_available_types
+get_description = BitPackingFactory.get_description
@@ -6,23 +6,47 @@ This module provides a graphical user interface for testing and using
 the bit packing compression algorithms interactively.
 """
 
+import multiprocessing
+import os
+import re
+import shutil
 import sys
+import tempfile
+import threading
 import traceback
 import time
 from typing import List, Dict, Any
 
+import numpy as np
+
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QGridLayout, QLabel, QLineEdit, QPushButton, QTextEdit, QComboBox,
+    QGridLayout, QLabel, QLineEdit, QPushButton, QTextEdit, QPlainTextEdit, QComboBox,
     QSpinBox, QGroupBox, QProgressBar, QTabWidget, QTableWidget,
     QTableWidgetItem, QSplitter, QMessageBox, QFileDialog, QCheckBox,
     QFrame, QScrollArea
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve
-from PyQt5.QtGui import QFont, QPixmap, QPalette, QColor, QIcon, QLinearGradient, QPainter
+from PyQt5.QtCore import Qt, QObject, QPoint, QRect, QRunnable, QThreadPool, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve
+from PyQt5.QtGui import QFont, QFontMetrics, QPixmap, QPalette, QColor, QIcon, QLinearGradient, QPainter
+
+from factory import BitPackingFactory
+from benchmark import BenchmarkSuite, DataGenerator, save_default_benchmark_report
+
 
-from factory import BitPackingFactory, CompressionType
-from benchmark import BenchmarkSuite, DataGenerator, run_default_benchmarks
+# QFont exige une QApplication: créée au premier usage, puis partagée
+_FONT_SPECS = {
+    'header': ("Arial", 28, QFont.Bold),  # Titre de l'en-tête
+    'mono': ("Consolas", 10, QFont.Normal),  # Texte des résultats
+}
+_fonts = {}
+
+
+def get_font(name):
+    """Return the shared QFont for `name` ('header' or 'mono')"""
+    font = _fonts.get(name)
+    if font is None:
+        font = _fonts[name] = QFont(*_FONT_SPECS[name])
+    return font
 
 
 class ModernStyleSheet:
@@ -161,7 +185,7 @@ class ModernStyleSheet:
         }
         
         /* Input Field Styling */
-        QLineEdit, QTextEdit {
+        QLineEdit, QTextEdit, QPlainTextEdit {
             background-color: #2c3e50;
             border: 2px solid #34495e;
             border-radius: 8px;
@@ -171,7 +195,7 @@ class ModernStyleSheet:
             selection-background-color: #3498db;
         }
         
-        QLineEdit:focus, QTextEdit:focus {
+        QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {
             border-color: #3498db;
             background-color: #34495e;
         }
@@ -315,6 +339,20 @@ class ModernStyleSheet:
             font-weight: bold;
         }
         
+        /* Title Header Styling */
+        QFrame[objectName="headerFrame"] {
+            background-color: #3498db;
+            border-radius: 15px;
+            margin: 5px;
+            border: 3px solid #2980b9;
+        }
+        
+        QLabel[objectName="headerTitleLabel"] {
+            color: white;
+            background: transparent;
+            border: none;
+        }
+        
         /* Status Bar Styling */
         QStatusBar {
             background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
@@ -369,20 +407,81 @@ class ModernStyleSheet:
         }
         """
 
+    @staticmethod
+    def get_lite_style():
+        """Flat variant of get_style(): solid fills and square corners, cheaper to repaint"""
+        style = ModernStyleSheet.get_style()
+        # Each gradient collapses to its first stop color
+        style = re.sub(r"qlineargradient\([^)]*?stop: 0 (#[0-9a-fA-F]+)[^)]*\)", r"\1", style)
+        return re.sub(r"(radius: )\d+px", r"\g<1>0", style)
+
+    @staticmethod
+    def use_lite_style():
+        """Lite mode on software/remote rendering, or when APP_LITE_UI is set"""
+        return (QApplication.platformName() in ("offscreen", "vnc")
+                or os.environ.get("QT_QUICK_BACKEND") == "software"
+                or bool(os.environ.get("APP_LITE_UI")))
+
 
-class CompressionWorker(QThread):
-    """Worker thread for compression operations to avoid UI freezing"""
+class WorkerSignals(QObject):
+    """Signals of a CompressionWorker (a QRunnable cannot declare signals itself)"""
 
     finished = pyqtSignal(dict)
     progress = pyqtSignal(str)
     error = pyqtSignal(str)
 
+
+class CompressionWorker(QRunnable):
+    """Pooled task for compression operations to avoid UI freezing"""
+
     def __init__(self, operation, data, algorithm='simple', **kwargs):
         super().__init__()
+        # The window keeps a reference to the worker: the pool must not delete it
+        self.setAutoDelete(False)
+        self.signals = WorkerSignals()
         self.operation = operation
         self.data = data
         self.algorithm = algorithm
         self.kwargs = kwargs
+        self._last_emit = 0.0
+        # Latest message held back by the throttle, sent when its window ends
+        self._pending_progress = None
+        self._progress_lock = threading.Lock()
+        self._running = False
+
+    def start(self):
+        """Run the operation on a thread of the global pool (threads are reused)"""
+        self._running = True
+        QThreadPool.globalInstance().start(self)
+
+    def isRunning(self):
+        """Same check as QThread.isRunning(): submitted and not finished yet"""
+        return self._running
+
+    def _emit_progress(self, message):
+        """Emit a progress message, at most 10 per second (each one repaints the UI)"""
+        with self._progress_lock:
+            wait = self._last_emit + 0.1 - time.monotonic()
+            if wait <= 0 and self._pending_progress is None:
+                self._last_emit = time.monotonic()
+                self.signals.progress.emit(message)
+                return
+
+            # Inside the window: keep only the latest message and send it when the
+            # window ends, so the status bar never stays on a stale stage
+            if self._pending_progress is None:
+                flush_timer = threading.Timer(max(wait, 0.0), self._flush_progress)
+                flush_timer.daemon = True
+                flush_timer.start()
+            self._pending_progress = message
+
+    def _flush_progress(self):
+        """Emit the progress message held back by the throttle, if any"""
+        with self._progress_lock:
+            message, self._pending_progress = self._pending_progress, None
+            if message is not None:
+                self._last_emit = time.monotonic()
+                self.signals.progress.emit(message)
 
     def run(self):
         try:
@@ -393,30 +492,37 @@ class CompressionWorker(QThread):
             elif self.operation == 'generate':
                 self.generate_data()
         except Exception as e:
-            self.error.emit(str(e))
+            self._flush_progress()
+            self.signals.error.emit(str(e))
+        finally:
+            self._running = False
 
     def compress_data(self):
         """Perform compression operation"""
-        self.progress.emit("Creating compressor...")
-        compressor = BitPackingFactory.create_compressor(self.algorithm)
+        self._emit_progress("Creating compressor...")
+        # One compressor per algorithm is reused across runs; compress() resets its state
+        compressor = BitPackingFactory.create_compressor(self.algorithm, shared=True)
 
-        self.progress.emit("Compressing data...")
+        # Compressors never modify their input: no defensive copies needed
+        self._emit_progress("Compressing data...")
         start_time = time.perf_counter()
-        compressed = compressor.compress(self.data.copy())
+        compressed = compressor.compress(self.data)
         compression_time = time.perf_counter() - start_time
 
-        self.progress.emit("Decompressing data...")
+        self._emit_progress("Decompressing data...")
         start_time = time.perf_counter()
-        decompressed = compressor.decompress(compressed.copy())
+        decompressed = compressor.decompress(compressed)
         decompression_time = time.perf_counter() - start_time
 
-        self.progress.emit("Testing random access...")
-        access_times = []
-        for access_index in range(min(10, len(self.data))):
-            start_time = time.perf_counter()
-            value = compressor.get(access_index)
-            access_time = time.perf_counter() - start_time
-            access_times.append(access_time)
+        self._emit_progress("Testing random access...")
+        # Time a whole batch with one clock pair: a single get() is close to
+        # the timer resolution and the per-call perf_counter() would dominate
+        num_accesses = min(1000, len(self.data))
+        get = compressor.get
+        start_time = time.perf_counter()
+        for access_index in range(num_accesses):
+            get(access_index)
+        access_time = time.perf_counter() - start_time
 
         # Calculate statistics
         original_size = len(self.data) * 32
@@ -429,7 +535,7 @@ class CompressionWorker(QThread):
             'decompressed_data': decompressed,
             'compression_time': compression_time,
             'decompression_time': decompression_time,
-            'average_access_time': sum(access_times) / len(access_times) if access_times else 0,
+            'average_access_time': access_time / num_accesses if num_accesses else 0,
             'original_size': original_size,
             'compressed_size': compressed_size,
             'compression_ratio': compression_ratio,
@@ -437,16 +543,21 @@ class CompressionWorker(QThread):
             'algorithm': self.algorithm
         }
 
-        self.finished.emit(result)
+        self._flush_progress()
+        self.signals.finished.emit(result)
 
     def run_benchmark(self):
         """Run benchmark on data"""
-        self.progress.emit("Running benchmarks...")
+        self._emit_progress("Running benchmarks...")
 
         benchmark_suite = BenchmarkSuite(num_iterations=10)
-        results = benchmark_suite.benchmark_selective_algorithms(self.data)
+        # Serial in this thread (comparable timings), progress after each algorithm
+        results = benchmark_suite.benchmark_selective_algorithms(
+            self.data, progress=lambda algorithm: self._emit_progress(f"Benchmarked {algorithm}...")
+        )
 
-        self.finished.emit({'benchmark_results': results})
+        self._flush_progress()
+        self.signals.finished.emit({'benchmark_results': results})
 
     def generate_data(self):
         """Generate test data"""
@@ -454,7 +565,7 @@ class CompressionWorker(QThread):
         data_type = self.kwargs.get('data_type', 'uniform')
         max_value = self.kwargs.get('max_value', 1000)
 
-        self.progress.emit(f"Generating {data_type} data...")
+        self._emit_progress(f"Generating {data_type} data...")
 
         if data_type == 'uniform':
             data = DataGenerator.generate_uniform(size, max_value)
@@ -469,15 +580,23 @@ class CompressionWorker(QThread):
         else:
             data = DataGenerator.generate_uniform(size, max_value)
 
+        # Reduce on the generator's array (C loops) before converting
+        min_value = int(data.min()) if data.size else 0
+        max_value = int(data.max()) if data.size else 0
+
+        # The widgets work on plain lists (truthiness checks, manual input)
+        data = data.tolist()
+
         result = {
             'generated_data': data,
             'size': len(data),
             'data_type': data_type,
-            'min_value': min(data) if data else 0,
-            'max_value': max(data) if data else 0
+            'min_value': min_value,
+            'max_value': max_value
         }
 
-        self.finished.emit(result)
+        self._flush_progress()
+        self.signals.finished.emit(result)
 
 
 class CompressionGUI(QMainWindow):
@@ -497,7 +616,10 @@ class CompressionGUI(QMainWindow):
         self.setMinimumSize(1000, 700)
 
         # Apply modern stylesheet
-        self.setStyleSheet(ModernStyleSheet.get_style())
+        if ModernStyleSheet.use_lite_style():
+            self.setStyleSheet(ModernStyleSheet.get_lite_style())
+        else:
+            self.setStyleSheet(ModernStyleSheet.get_style())
 
         # Create central widget and main layout
         central_widget = QWidget()
@@ -535,46 +657,63 @@ class CompressionGUI(QMainWindow):
         """Create a beautiful title header"""
         header_frame = QFrame()
         header_frame.setFixedHeight(120)  # Increased from 90 to 120
-        header_frame.setStyleSheet("""
-            QFrame {
-                background-color: #3498db;
-                border-radius: 15px;
-                margin: 5px;
-                border: 3px solid #2980b9;
-            }
-        """)
+        # Styled by the global sheet: no per-widget sheet for Qt to re-resolve
+        header_frame.setObjectName("headerFrame")
 
         header_layout = QHBoxLayout(header_frame)
         header_layout.setContentsMargins(20, 15, 20, 15)  # Increased vertical margins
 
         # Title with bigger font size
-        title_label = QLabel("🔧 Bit Packing Compression Studio")
+        title_label = QLabel()
         title_label.setAlignment(Qt.AlignCenter)
 
-        # Set font programmatically with larger size
-        font = QFont()
-        font.setFamily("Arial")
-        font.setPointSize(28)    # Increased from 18 to 28 for much bigger text
-        font.setBold(True)
-        title_label.setFont(font)
-
-        # Remove ALL CSS styling that might interfere
-        title_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                background: transparent;
-                border: none;
-            }
-        """)
-
-        # Force the text to be visible by setting it multiple ways
-        title_label.setText("🔧 Bit Packing Compression Studio")
+        # Plain white text on the header, styled by the global sheet
+        title_label.setObjectName("headerTitleLabel")
+
+        # Shape the emoji + text once per pixel ratio: repaints then only blit the pixmap
+        self.title_label = title_label
+        self.title_text = "🔧 Bit Packing Compression Studio"
+        self.title_pixel_ratio = None
+        self.update_title_pixmap()
         title_label.setVisible(True)
         title_label.show()
 
         header_layout.addWidget(title_label)
         layout.addWidget(header_frame)
 
+    def update_title_pixmap(self):
+        """Redraw the title pixmap if the window's pixel ratio changed since the last drawing"""
+        pixel_ratio = self.devicePixelRatioF()
+        if pixel_ratio != self.title_pixel_ratio:
+            self.title_pixel_ratio = pixel_ratio
+            self.title_label.setPixmap(self.render_title_pixmap(self.title_text, get_font("header")))
+
+    def showEvent(self, event):
+        """Follow screen changes once the native window exists (DPI may differ per screen)"""
+        super().showEvent(event)
+        window = self.windowHandle()
+        if window is not None and not getattr(self, 'screen_change_connected', False):
+            window.screenChanged.connect(lambda screen: self.update_title_pixmap())
+            self.screen_change_connected = True
+        # The pixel ratio is only final once the window is on its screen
+        self.update_title_pixmap()
+
+    def render_title_pixmap(self, text, font):
+        """Render the header title into a pixmap sized for the screen's pixel ratio"""
+        text_size = QFontMetrics(font).size(0, text)
+        pixel_ratio = self.devicePixelRatioF()
+
+        pixmap = QPixmap(text_size * pixel_ratio)
+        pixmap.setDevicePixelRatio(pixel_ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.setPen(Qt.white)
+        painter.drawText(QRect(QPoint(0, 0), text_size), Qt.AlignCenter, text)
+        painter.end()
+        return pixmap
+
     def apply_animations(self):
         """Apply subtle animations to enhance user experience"""
         # This could be expanded with more sophisticated animations
@@ -665,7 +804,9 @@ class CompressionGUI(QMainWindow):
         self.data_info_label.setObjectName("infoLabel")
         current_data_layout.addWidget(self.data_info_label)
 
-        self.data_preview = QTextEdit()
+        # Plain-text widget: the preview is never rich text, skip the HTML layout
+        self.data_preview = QPlainTextEdit()
+        self.data_preview.setMaximumBlockCount(1)
         self.data_preview.setMaximumHeight(120)
         self.data_preview.setReadOnly(True)
         current_data_layout.addWidget(self.data_preview)
@@ -697,8 +838,8 @@ class CompressionGUI(QMainWindow):
 
         self.algorithm_combo = QComboBox()
         self.algorithm_combo.setFixedHeight(40)
-        for comp_type in CompressionType:
-            self.algorithm_combo.addItem(f"��� {comp_type.value.capitalize()}", comp_type.value)
+        for algorithm in BitPackingFactory.get_available_types():
+            self.algorithm_combo.addItem(f"��� {algorithm.capitalize()}", algorithm)
         algorithm_layout.addWidget(self.algorithm_combo)
 
         # Algorithm description
@@ -823,7 +964,7 @@ class CompressionGUI(QMainWindow):
 
         self.results_text = QTextEdit()
         self.results_text.setReadOnly(True)
-        self.results_text.setFont(QFont("Consolas", 10))
+        self.results_text.setFont(get_font("mono"))
         results_layout.addWidget(self.results_text)
 
         layout.addWidget(results_group)
@@ -857,7 +998,8 @@ class CompressionGUI(QMainWindow):
                 QMessageBox.warning(self, "Warning", "Please enter some data")
                 return
 
-            data = [int(x) for x in text.split()]
+            # np.array validates every token (ValueError/OverflowError), unlike np.fromstring
+            data = np.array(text.split(), dtype=np.int64).tolist()
             if not data:
                 QMessageBox.warning(self, "Warning", "No valid integers found")
                 return
@@ -867,7 +1009,7 @@ class CompressionGUI(QMainWindow):
             self.update_data_display()
             self.statusBar().showMessage(f"Loaded {len(data)} integers from manual input")
 
-        except ValueError:
+        except (ValueError, OverflowError):
             QMessageBox.critical(self, "Error", "Invalid input. Please enter integers separated by spaces.")
 
     def load_data_from_file(self):
@@ -882,7 +1024,7 @@ class CompressionGUI(QMainWindow):
         try:
             with open(file_path, 'r') as file:
                 content = file.read().strip()
-                data = [int(x) for x in content.split()]
+                data = np.array(content.split(), dtype=np.int64).tolist()
 
                 self.current_data = data
                 self.update_data_display()
@@ -906,16 +1048,16 @@ class CompressionGUI(QMainWindow):
                 'generate', [], size=size, data_type=data_type,
                 max_value=max_value, outlier_value=outlier_value
             )
-            self.generation_worker.finished.connect(self.on_generation_finished)
-            self.generation_worker.progress.connect(self.update_status)
-            self.generation_worker.error.connect(self.on_error)
+            self.generation_worker.signals.finished.connect(self.on_generation_finished)
+            self.generation_worker.signals.progress.connect(self.update_status)
+            self.generation_worker.signals.error.connect(self.on_error)
             self.generation_worker.start()
 
     def update_data_display(self):
         """Update the data display widgets"""
         if not self.current_data:
             self.data_info_label.setText("ℹ️ No data loaded")
-            self.data_preview.setText("")
+            self.data_preview.setPlainText("")
             self.access_index_spinbox.setMaximum(0)
             return
 
@@ -930,7 +1072,7 @@ class CompressionGUI(QMainWindow):
         preview_text = " ".join(map(str, preview_data))
         if len(self.current_data) > 20:
             preview_text += "..."
-        self.data_preview.setText(preview_text)
+        self.data_preview.setPlainText(preview_text)
 
         # Update access index range
         self.access_index_spinbox.setMaximum(len(self.current_data) - 1)
@@ -968,9 +1110,9 @@ class CompressionGUI(QMainWindow):
             self.compression_worker = CompressionWorker(
                 'compress', self.current_data, algorithm
             )
-            self.compression_worker.finished.connect(self.on_compression_finished)
-            self.compression_worker.progress.connect(self.update_status)
-            self.compression_worker.error.connect(self.on_error)
+            self.compression_worker.signals.finished.connect(self.on_compression_finished)
+            self.compression_worker.signals.progress.connect(self.update_status)
+            self.compression_worker.signals.error.connect(self.on_error)
             self.compression_worker.start()
 
     def test_random_access(self):
@@ -1027,34 +1169,89 @@ class CompressionGUI(QMainWindow):
             self.benchmark_worker = CompressionWorker(
                 'benchmark', self.current_data, has_negatives=has_negatives
             )
-            self.benchmark_worker.finished.connect(self.on_benchmark_finished)
-            self.benchmark_worker.progress.connect(self.update_status)
-            self.benchmark_worker.error.connect(self.on_error)
+            self.benchmark_worker.signals.finished.connect(self.on_benchmark_finished)
+            self.benchmark_worker.signals.progress.connect(self.update_status)
+            self.benchmark_worker.signals.error.connect(self.on_error)
             self.benchmark_worker.start()
 
     def run_default_benchmarks(self):
         """Run default benchmarks with preset datasets"""
+        process = getattr(self, 'default_benchmark_process', None)
+        if process is not None and process.is_alive():
+            return
+
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)
         self.update_status("Running default benchmarks...")
 
-        try:
-            # This might take a while, so we run it in a separate thread
-            results = run_default_benchmarks()
+        # CPU-bound sweep: run it in a child process (no GIL contention with the UI)
+        # and pick up the report file it writes when done
+        self.default_benchmark_dir = tempfile.mkdtemp(prefix="bitpacking_benchmarks_")
+        self.default_benchmark_path = os.path.join(self.default_benchmark_dir, "report.txt")
+
+        # One poll both picks up the report and notices a child that died without
+        # writing it; the timer is created once and reused by later runs
+        if getattr(self, 'default_benchmark_timer', None) is None:
+            self.default_benchmark_timer = QTimer(self)
+            self.default_benchmark_timer.timeout.connect(self.check_default_benchmarks)
+        self.default_benchmark_timer.start(500)
 
-            # Display results in the results tab
-            from benchmark import BenchmarkSuite
-            benchmark_suite = BenchmarkSuite()
-            report = benchmark_suite.generate_report(results)
+        self.default_benchmark_process = multiprocessing.get_context("spawn").Process(
+            target=save_default_benchmark_report, args=(self.default_benchmark_path,)
+        )
+        self.default_benchmark_process.start()
+
+    def check_default_benchmarks(self):
+        """Display the default benchmark report once the child process has written it"""
+        if not self.default_benchmark_timer.isActive():
+            return  # Late signal: the run was already handled
+
+        process = self.default_benchmark_process
+        if os.path.exists(self.default_benchmark_path):
+            with open(self.default_benchmark_path, encoding="utf-8") as f:
+                report = f.read()
+            error = None
+        elif process.exitcode is not None:
+            report = None
+            error = f"Default benchmarks failed (exit code {process.exitcode})"
+        else:
+            return
+
+        self.cleanup_default_benchmarks()
+
+        if error is not None:
+            self.on_error(error)
+            return
 
-            self.results_text.append("=== DEFAULT BENCHMARKS RESULTS ===\n")
-            self.results_text.append(report)
+        # Display results in the results tab
+        self.results_text.append("=== DEFAULT BENCHMARKS RESULTS ===\n")
+        self.results_text.append(report)
 
+        self.progress_bar.setVisible(False)
+        self.statusBar().showMessage("Default benchmarks completed")
+
+    def cleanup_default_benchmarks(self):
+        """Stop polling the default benchmark run, end its process and remove its directory"""
+        self.default_benchmark_timer.stop()
+
+        process = self.default_benchmark_process
+        if process.is_alive():
+            process.terminate()
+        process.join()
+        shutil.rmtree(self.default_benchmark_dir, ignore_errors=True)
+
+    def cancel_default_benchmarks(self):
+        """Cancel a running default benchmark sweep, if any"""
+        timer = getattr(self, 'default_benchmark_timer', None)
+        if timer is not None and timer.isActive():
+            self.cleanup_default_benchmarks()
             self.progress_bar.setVisible(False)
-            self.statusBar().showMessage("Default benchmarks completed")
+            self.statusBar().showMessage("Default benchmarks cancelled")
 
-        except Exception as e:
-            self.on_error(str(e))
+    def closeEvent(self, event):
+        """Terminate the default benchmark process instead of waiting for it at exit"""
+        self.cancel_default_benchmarks()
+        super().closeEvent(event)
 
     def update_status(self, message):
         """Update status bar message"""
@@ -1126,17 +1323,26 @@ class CompressionGUI(QMainWindow):
 
     def update_benchmark_table(self, results):
         """Update benchmark results table"""
-        self.benchmark_table.setRowCount(len(results))
-
-        for row, (algorithm, metrics) in enumerate(results.items()):
-            self.benchmark_table.setItem(row, 0, QTableWidgetItem(algorithm.upper()))
-            self.benchmark_table.setItem(row, 1, QTableWidgetItem(f"{metrics['compression_ratio']:.3f}x"))
-            self.benchmark_table.setItem(row, 2, QTableWidgetItem(f"{metrics['compression_time']:.3f}"))
-            self.benchmark_table.setItem(row, 3, QTableWidgetItem(f"{metrics['decompression_time']:.3f}"))
-            self.benchmark_table.setItem(row, 4, QTableWidgetItem(f"{metrics['access_time']:.3f}"))
-            self.benchmark_table.setItem(row, 5, QTableWidgetItem(f"{metrics['compressed_size'] // 8}"))
-
-        self.benchmark_table.resizeColumnsToContents()
+        table = self.benchmark_table
+        # Fill the table in one batch: no repaint or re-sort per setItem()
+        sorting_enabled = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        try:
+            table.setRowCount(len(results))
+
+            for row, (algorithm, metrics) in enumerate(results.items()):
+                table.setItem(row, 0, QTableWidgetItem(algorithm.upper()))
+                table.setItem(row, 1, QTableWidgetItem(f"{metrics['compression_ratio']:.3f}x"))
+                table.setItem(row, 2, QTableWidgetItem(f"{metrics['compression_time']:.3f}"))
+                table.setItem(row, 3, QTableWidgetItem(f"{metrics['decompression_time']:.3f}"))
+                table.setItem(row, 4, QTableWidgetItem(f"{metrics['access_time']:.3f}"))
+                table.setItem(row, 5, QTableWidgetItem(f"{metrics['compressed_size'] // 8}"))
+
+            table.resizeColumnsToContents()
+        finally:
+            table.setSortingEnabled(sorting_enabled)
+            table.setUpdatesEnabled(True)
 
     def save_results(self):
         """Save results to file"""
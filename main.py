@@ -232,7 +232,7 @@ def run_custom_benchmark():
             data_name = f"Uniforme({size}, max={max_value})"
 
         print(f"\nGénéré {data_name}")
-        print(f"Échantillon de données: {data[:10]}{'...' if len(data) > 10 else ''}")
+        print(f"Échantillon de données: {data[:10].tolist()}{'...' if len(data) > 10 else ''}")
 
         # Exécuter le benchmark
         datasets = {data_name: data}
@@ -9,8 +9,13 @@ correction, l'intégrité des données, et les cas limites.
 
 import unittest
 import random
+from unittest import mock
+
+import numpy as np
+
 from factory import BitPackingFactory, CompressionType
-from bit_packing import SimpleBitPacking, AlignedBitPacking, OverflowBitPacking
+import bit_packing
+from bit_packing import SimpleBitPacking, AlignedBitPacking, OverflowBitPacking, ZigZagBitPacking
 
 
 class TestBitPackingAlgorithms(unittest.TestCase):
@@ -92,6 +97,122 @@ class TestBitPackingAlgorithms(unittest.TestCase):
             decompressed = compressor.decompress(compressed.copy())
             self.assertEqual(decompressed, test_data)
 
+    def test_factory_shared_instances(self):
+        """Tester que shared=True réutilise une instance par type, et seulement dans ce cas"""
+        for comp_type in CompressionType:
+            shared = BitPackingFactory.create_compressor(comp_type, shared=True)
+            self.assertIs(BitPackingFactory.create_compressor(comp_type.value, shared=True), shared)
+            self.assertIsNot(BitPackingFactory.create_compressor(comp_type), shared)
+
+    def test_factory_batch_creation(self):
+        """Tester la création groupée: un compresseur par type demandé, dans l'ordre"""
+        types = ["simple", CompressionType.ALIGNED, "SIMPLE", "overflow"]
+        compressors = BitPackingFactory.create_compressors(types)
+
+        self.assertEqual([type(c) for c in compressors],
+                         [SimpleBitPacking, AlignedBitPacking, SimpleBitPacking, OverflowBitPacking])
+        self.assertIsNot(compressors[0], compressors[2])
+
+        with self.assertRaises(ValueError):
+            BitPackingFactory.create_compressors(["simple", "inconnu"])
+
+    def test_numpy_input(self):
+        """Tester que les compresseurs acceptent directement un tableau NumPy"""
+        test_data = [1, 2, 3, 1024, 4, 5, 2048, 6]
+
+        for comp_type in CompressionType:
+            compressor = BitPackingFactory.create_compressor(comp_type)
+            compressed = compressor.compress(np.array(test_data, dtype=np.int64))
+            decompressed = compressor.decompress(compressed.copy())
+
+            self.assertEqual(decompressed, test_data)
+            self.assertEqual(compressor.get(3), 1024)
+
+    def test_get_many(self):
+        """Tester l'accès direct groupé pour tous les algorithmes"""
+        test_data = [1, -2, 3, 1024, 4, 5, 2048, -6]
+        indices = [7, 0, 3, 3, 6]
+
+        for comp_type in [CompressionType.ALIGNED, CompressionType.ZIGZAG]:
+            compressor = BitPackingFactory.create_compressor(comp_type)
+            compressor.compress(test_data)
+            values = compressor.get_many(indices)
+
+            self.assertEqual(values.tolist(), [test_data[i] for i in indices])
+            with self.assertRaises(IndexError):
+                compressor.get_many([len(test_data)])
+
+        for comp_type in [CompressionType.SIMPLE, CompressionType.OVERFLOW]:
+            compressor = BitPackingFactory.create_compressor(comp_type)
+            compressor.compress([abs(v) for v in test_data])
+            values = compressor.get_many(indices)
+
+            self.assertEqual(values.tolist(), [abs(test_data[i]) for i in indices])
+
+    def test_wide_values(self):
+        """Tester les largeurs de plus de 32 bits (une valeur peut toucher trois mots)"""
+        unsigned_data = [random.randrange(2**50) for _ in range(100)] + [2**63 - 1, 0]
+        signed_data = [random.randint(-2**49, 2**49) for _ in range(100)] + [-2**63, 2**63 - 1]
+
+        for compressor, test_data in [(SimpleBitPacking(), unsigned_data),
+                                      (ZigZagBitPacking(), signed_data)]:
+            with self.subTest(compressor=type(compressor).__name__):
+                compressed = compressor.compress(test_data)
+                self.assertEqual(compressed.dtype, np.uint32)
+                self.assertEqual(compressor.decompress(compressed), test_data)
+                self.assertEqual([compressor.get(i) for i in range(len(test_data))], test_data)
+                self.assertEqual(compressor.get_many(range(len(test_data))).tolist(), test_data)
+
+    def test_aligned_large_offsets(self):
+        """Tester l'offset du packing aligné hors de la plage 32 bits signée"""
+        compressor = AlignedBitPacking()
+
+        for test_data in [[3_000_000_000, 3_000_000_001], [2**40, 2**40 + 3],
+                          [-2**40, -2**40 + 7], [-2**63, -2**63 + 1]]:
+            with self.subTest(data=test_data):
+                compressed = compressor.compress(test_data)
+                self.assertEqual(compressor.decompress(compressed), test_data)
+                # decompress() relit l'offset: get() doit rester correct après
+                self.assertEqual([compressor.get(i) for i in range(len(test_data))], test_data)
+
+        with self.assertRaises(ValueError):
+            compressor.compress([0, 2**40])
+
+    def test_overflow_wide_outliers(self):
+        """Tester les outliers de plus de 32 bits dans la zone d'overflow"""
+        compressor = OverflowBitPacking()
+        test_data = [1, 2, 3, 4, 5, 6, 7, 1, 2, 3, 2**40, 5, 2**33 + 1, 2**40]
+
+        compressed = compressor.compress(test_data)
+        self.assertTrue(compressor.has_overflow_bit)
+        self.assertEqual(compressor.decompress(compressed), test_data)
+        self.assertEqual([compressor.get(i) for i in range(len(test_data))], test_data)
+        self.assertEqual(compressor.get_many(range(len(test_data))).tolist(), test_data)
+
+    def test_blocked_kernels(self):
+        """Tester le découpage en tuiles et en blocs parallèles, largeurs 1 à 32"""
+        size = 1000
+        for num_bits in range(1, 33):
+            # Valeurs aléatoires plus les deux extrêmes de la largeur
+            test_data = [random.randrange(2**num_bits) for _ in range(size - 2)] + [2**num_bits - 1, 0]
+            # Largeur 1 -> packbits, 8/16/32 -> vues d'octets, autres diviseurs de 32 -> aligné
+            for compressor_class in (SimpleBitPacking, AlignedBitPacking):
+                with self.subTest(bits=num_bits, compressor=compressor_class.__name__):
+                    serial = compressor_class().compress(test_data)
+
+                    # Petites tuiles et blocs: plusieurs frontières dans 1000 valeurs
+                    compressor = compressor_class()
+                    with mock.patch.object(bit_packing, "_PARALLEL_MIN_VALUES", 100), \
+                         mock.patch.object(bit_packing, "_PARALLEL_WORKERS", 3), \
+                         mock.patch.object(bit_packing, "_TILE_VALUES", 37):
+                        compressed = compressor.compress(test_data)
+                        decompressed = compressor.decompress(compressed)
+
+                    self.assertEqual(compressed.tolist(), serial.tolist())
+                    self.assertEqual(decompressed, test_data)
+                    self.assertEqual(compressor.get_many(range(size)).tolist(), test_data)
+                    self.assertEqual([compressor.get(i) for i in range(0, size, 7)], test_data[::7])
+
     def test_compression_ratios(self):
         """Tester les ratios de compression - vérifier que la compression est efficace"""
         # Générer des données avec petites valeurs (devraient bien se compresser)